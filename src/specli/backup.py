@@ -8,12 +8,191 @@ during update operations. It handles:
 - Safety checks to ensure backups complete before updates
 """
 
+import errno
+import itertools
+import os
 import shutil
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, BinaryIO, Callable, Dict, FrozenSet, Iterator, List, Tuple
 
-import click
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# File copies are I/O bound, so oversubscribe the CPUs as ThreadPoolExecutor does
+COPY_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Per-call sendfile chunk and userspace fallback buffer for non-cloned copies
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Linux FICLONE ioctl request, _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+CAN_REFLINK = fcntl is not None and sys.platform.startswith("linux")
+
+
+def _stream_copy(source: BinaryIO, destination: BinaryIO) -> None:
+    """
+    Copy the full contents of one open file into another within the kernel.
+
+    Readahead is primed with a sequential-access hint and the bytes are moved
+    with sendfile; if sendfile is refused up front, a large-buffer userspace
+    copy takes over.
+
+    Args:
+        source: File opened for binary reading, positioned at the start
+        destination: Empty file opened for binary writing
+    """
+    source_fd = source.fileno()
+    destination_fd = destination.fileno()
+    os.posix_fadvise(source_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    offset = 0
+    try:
+        while True:
+            sent = os.sendfile(destination_fd, source_fd, offset, COPY_CHUNK_SIZE)
+            if sent == 0:
+                return
+            offset += sent
+    except OSError:
+        if offset:
+            raise
+    shutil.copyfileobj(source, destination, COPY_BUFFER_SIZE)
+
+
+def _clone_file(source: str, destination: str) -> None:
+    """
+    Copy a file, sharing its data blocks with the source when the filesystem allows.
+
+    On copy-on-write filesystems (Btrfs, XFS) the FICLONE ioctl makes the copy
+    a metadata-only operation. Unlike a hardlink, the clone stays independent of
+    later in-place writes to the source, which update's merge performs. When
+    cloning is refused the same descriptors are reused for a kernel-side copy;
+    off Linux this is shutil.copy2.
+
+    Args:
+        source: File to copy
+        destination: Path of the new file
+    """
+    if not CAN_REFLINK:
+        shutil.copy2(source, destination)
+        return
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            _stream_copy(src, dst)
+    shutil.copystat(source, destination)
+
+
+def confirm(text: str, default: bool = False) -> bool:
+    """
+    Ask the user a yes/no question on the terminal.
+
+    click is imported on first use, so the --no-backup path never loads it.
+
+    Args:
+        text: Question to display
+        default: Answer assumed when the user just presses Enter
+
+    Returns:
+        True if the user answered yes, False otherwise
+    """
+    import click
+
+    return click.confirm(text, default=default)
+
+
+def _walk_entries(
+    root: str, ancestors: FrozenSet[Tuple[int, int]]
+) -> Iterator[os.DirEntry]:
+    """
+    Yield every entry below a directory, depth first, following directory symlinks.
+
+    Plain entries are classified from the file type readdir already reports;
+    only directories are stat'ed, to identify them. A directory whose
+    (st_dev, st_ino) is already on the current path is a symlink cycle.
+
+    Args:
+        root: Directory to walk
+        ancestors: (st_dev, st_ino) of root and every directory above it
+
+    Yields:
+        os.DirEntry for each file, directory and symlink below root
+
+    Raises:
+        OSError: If a directory symlink loops back to one of its ancestors
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            yield entry
+            if entry.is_dir():
+                stat_result = entry.stat()
+                identity = (stat_result.st_dev, stat_result.st_ino)
+                if identity in ancestors:
+                    raise OSError(errno.ELOOP, "Symlink cycle", entry.path)
+                yield from _walk_entries(entry.path, ancestors | {identity})
+
+
+def _fast_copytree(source: Path, destination: Path) -> None:
+    """
+    Copy a directory tree, creating all directories before copying files in parallel.
+
+    Files are reflinked where the filesystem supports it and otherwise copied
+    with shutil.copy2, which already uses the platform's zero-copy primitives;
+    the win is overlapping the per-file open/copy/close round trips, which
+    dominate trees of many small files.
+    Symlinks are copied through, as shutil.copytree does by default.
+
+    Args:
+        source: Directory to copy
+        destination: Directory to create; must not already exist
+
+    Raises:
+        shutil.SpecialFileError: If the tree contains a named pipe or socket
+        OSError: If the destination exists, a symlink is broken or loops, or
+            any directory or file copy fails
+    """
+    source_root = str(source)
+    destination_root = str(destination)
+    prefix_length = len(source_root) + len(os.sep)
+
+    directories: List[str] = [destination_root]
+    files: List[Tuple[str, str]] = []
+
+    root_stat = os.stat(source_root)
+    root_identity = frozenset({(root_stat.st_dev, root_stat.st_ino)})
+    for entry in _walk_entries(source_root, root_identity):
+        destination_entry = os.path.join(destination_root, entry.path[prefix_length:])
+        if entry.is_dir():
+            directories.append(destination_entry)
+        elif entry.is_file():
+            files.append((entry.path, destination_entry))
+        elif entry.is_symlink() and not os.path.exists(entry.path):
+            raise FileNotFoundError(errno.ENOENT, "Broken symlink", entry.path)
+        else:
+            # Opening a FIFO would block forever; refuse it like shutil.copy2
+            raise shutil.SpecialFileError(f"`{entry.path}` is a named pipe or socket")
+
+    # Single-threaded pass so every file copy finds its parent directory in place.
+    # The walk is pre-order, so each directory follows its parent and one mkdir
+    # per directory suffices.
+    os.makedirs(directories[0])
+    for directory in directories[1:]:
+        os.mkdir(directory)
+
+    if not files:
+        return
+
+    sources, destinations = zip(*files)
+    with ThreadPoolExecutor(max_workers=min(COPY_MAX_WORKERS, len(files))) as pool:
+        # Consume the results so the first failed copy is re-raised here
+        list(pool.map(_clone_file, sources, destinations))
 
 
 class BackupManager:
@@ -26,14 +205,17 @@ class BackupManager:
     - Handle backup failures safely
     """
 
-    def __init__(self, target_path: Path):
+    def __init__(self, target_path: Path, clock: Callable[[], int] = time.time_ns):
         """
         Initialize BackupManager for a target directory.
 
         Args:
             target_path: Path to directory containing .claude folder
+            clock: Nanosecond timestamp source for backup folder names
         """
         self.target_path = target_path
+        self._clock = clock
+        self._backup_sequence = itertools.count()
 
     def should_create_backup(self, no_backup: bool = False) -> bool:
         """
@@ -48,9 +230,7 @@ class BackupManager:
         if no_backup:
             return False
 
-        return click.confirm(
-            "Create backup of .claude folder before update?", default=True
-        )
+        return confirm("Create backup of .claude folder before update?", default=True)
 
     def create_claude_backup(self) -> Dict[str, Any]:
         """
@@ -72,20 +252,21 @@ class BackupManager:
             backup_root = self.target_path / ".claude-backup"
             backup_root.mkdir(exist_ok=True)
 
-            # Generate unique timestamp-based backup name
-            timestamp = int(time.time())
-            backup_name = f"{timestamp}"
-            backup_path = backup_root / backup_name
-
-            # Ensure backup name is unique
-            counter = 1
-            while backup_path.exists():
-                backup_name = f"{timestamp}_{counter}"
+            # Nanosecond timestamps keep names chronological; the per-manager
+            # sequence keeps back-to-back backups distinct. Another manager or
+            # a coarse clock can still collide, so claim the name atomically
+            # and move on to the next sequence number if it is taken.
+            while True:
+                backup_name = f"{self._clock()}_{next(self._backup_sequence)}"
                 backup_path = backup_root / backup_name
-                counter += 1
+                try:
+                    backup_path.mkdir()
+                    break
+                except FileExistsError:
+                    continue
 
             # Copy .claude folder to backup location
-            shutil.copytree(claude_folder, backup_path / ".claude")
+            _fast_copytree(claude_folder, backup_path / ".claude")
 
             return {"success": True, "backup_path": backup_path}
 
@@ -6,9 +6,51 @@ information for deployment and update operations.
 """
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Fields every saved configuration must carry, in reporting order
+CONFIG_FIELD_ORDER = ("repository_url", "deployed_at")
+REQUIRED_CONFIG_FIELDS = frozenset(CONFIG_FIELD_ORDER)
+
+# Successfully loaded configurations keyed by absolute config file path. Each
+# entry records the (inode, mtime_ns, size) it was parsed from; save_config
+# always swaps in a new inode, so rewrites within one mtime tick still miss.
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
+# json.dumps builds a fresh encoder whenever options are passed; build it once
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize configuration data to two-space indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return _JSON_ENCODER.encode(data).encode("utf-8")
+
+
+def _write_all(
+    fd: int, payload: bytes, write: Callable[[int, bytes], int] = os.write
+) -> None:
+    """Write every byte of payload to fd; os.write may write fewer per call."""
+    remaining = memoryview(payload)
+    while remaining:
+        remaining = remaining[write(fd, remaining) :]
+
+
+def _loads(payload: bytes) -> Any:
+    """Parse UTF-8 JSON configuration data."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
 
 
 def save_config(
@@ -38,9 +80,22 @@ def save_config(
             "deployed_at": datetime.now().replace(microsecond=0).isoformat() + "Z",
         }
 
-        # Write configuration to file
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config_data, f, indent=2, ensure_ascii=False)
+        # Serialize once, then write atomically through a sibling temp file
+        payload = _dumps(config_data)
+        temp_file = config_file.with_name(config_file.name + ".tmp")
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                _write_all(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(temp_file, config_file)
+        except OSError:
+            # Leave the previous config in place and no stray temp file behind
+            temp_file.unlink(missing_ok=True)
+            raise
+        _CONFIG_CACHE.pop(config_file.absolute(), None)
 
         return {
             "success": True,
@@ -72,7 +127,9 @@ def load_config(target_path: Path) -> Dict[str, Any]:
     config_file = target_path / "specli.settings.json"
 
     try:
-        if not config_file.exists():
+        try:
+            stat_result = config_file.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return {
                 "repository_url": None,
                 "branch": None,
@@ -80,30 +137,45 @@ def load_config(target_path: Path) -> Dict[str, Any]:
                 "config_file": config_file,
             }
 
+        # Serve unchanged files from the cache; callers get their own copy
+        cache_key = config_file.absolute()
+        signature = (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return dict(cached[1])
+
         # Read and parse the configuration file
-        with open(config_file, encoding="utf-8") as f:
-            config_data = json.load(f)
-
-        # Validate required fields
-        required_fields = ["repository_url", "deployed_at"]
-        for field in required_fields:
-            if field not in config_data:
-                return {
-                    "repository_url": None,
-                    "branch": None,
-                    "config_exists": False,
-                    "config_file": config_file,
-                    "error": f"Missing required field: {field}",
-                }
+        config_data = _loads(config_file.read_bytes())
+
+        # Validate structure: a JSON object carrying every required field
+        if not isinstance(config_data, dict):
+            return {
+                "repository_url": None,
+                "branch": None,
+                "config_exists": False,
+                "config_file": config_file,
+                "error": "Configuration file must contain a JSON object",
+            }
+        if not REQUIRED_CONFIG_FIELDS.issubset(config_data):
+            missing = next(f for f in CONFIG_FIELD_ORDER if f not in config_data)
+            return {
+                "repository_url": None,
+                "branch": None,
+                "config_exists": False,
+                "config_file": config_file,
+                "error": f"Missing required field: {missing}",
+            }
 
         # Return loaded configuration
-        return {
+        config = {
             "repository_url": config_data["repository_url"],
             "branch": config_data.get("branch"),  # Optional field
             "deployed_at": config_data["deployed_at"],
             "config_exists": True,
             "config_file": config_file,
         }
+        _CONFIG_CACHE[cache_key] = (signature, config)
+        return dict(config)
 
     except (json.JSONDecodeError, OSError) as e:
         return {
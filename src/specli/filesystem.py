@@ -9,11 +9,14 @@ This module handles:
 - File system error handling
 """
 
+import hashlib
+import os
 import shutil
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Tuple
 
-from .backup import BackupManager
+# Target-local files an update merge never overwrites
+PRESERVED_FILE_PATTERNS = ("settings.local.json",)
 
 
 class ClaudeFolderNotFoundError(Exception):
@@ -28,6 +31,29 @@ class ClaudeFolderCorruptedError(Exception):
     pass
 
 
+def _iter_files(directory: Path, prefix: str = "") -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Recursively yield files below a directory using os.scandir.
+
+    Entry type checks reuse the directory listing instead of issuing a stat
+    call per entry. Symlinked directories are not followed.
+
+    Args:
+        directory: Directory to walk
+        prefix: Relative path prefix for yielded entries (used for recursion)
+
+    Yields:
+        Tuples of (relative POSIX path, DirEntry) for every file
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            relative_path = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path, relative_path + "/")
+            elif entry.is_file():
+                yield relative_path, entry
+
+
 def detect_claude_folder(repo_path: Path) -> Path:
     """
     Detect and validate .claude folder in repository.
@@ -89,14 +115,14 @@ def get_claude_folder_info(claude_path: Path) -> Dict[str, any]:
         return info
 
     # Calculate total size and file count
-    for file_path in claude_path.rglob("*"):
-        if file_path.is_file():
-            info["files"].append(file_path.relative_to(claude_path))
-            info["size_bytes"] += file_path.stat().st_size
+    for relative_path, entry in _iter_files(claude_path):
+        file_path = Path(relative_path)
+        info["files"].append(file_path)
+        info["size_bytes"] += entry.stat().st_size
 
-            # Count command files
-            if file_path.parent.name == "commands" and file_path.suffix == ".md":
-                info["command_count"] += 1
+        # Count command files
+        if file_path.parent.name == "commands" and file_path.suffix == ".md":
+            info["command_count"] += 1
 
     # Check for settings files
     info["has_settings"] = (claude_path / "settings.json").exists()
@@ -105,6 +131,38 @@ def get_claude_folder_info(claude_path: Path) -> Dict[str, any]:
     return info
 
 
+def get_claude_folder_manifest(claude_path: Path) -> Dict[str, str]:
+    """
+    Build a content manifest of every file in a .claude folder.
+
+    Args:
+        claude_path: Path to .claude folder
+
+    Returns:
+        Dictionary mapping relative POSIX file paths to BLAKE2b content digests
+    """
+    manifest = {}
+
+    for relative_path, entry in _iter_files(claude_path):
+        with open(entry.path, "rb") as f:
+            manifest[relative_path] = hashlib.blake2b(f.read()).hexdigest()
+
+    return manifest
+
+
+def is_preserved_file(relative_path: str) -> bool:
+    """
+    Check whether an update merge keeps the target's copy of a file.
+
+    Args:
+        relative_path: POSIX path relative to the .claude folder
+
+    Returns:
+        True if the file matches one of PRESERVED_FILE_PATTERNS
+    """
+    return any(pattern in relative_path for pattern in PRESERVED_FILE_PATTERNS)
+
+
 def copy_claude_folder(
     source_path: Path, target_repo: Path, create_backup_if_exists: bool = True
 ) -> Dict[str, any]:
@@ -141,6 +199,9 @@ def copy_claude_folder(
     try:
         # Create backup if target exists
         if target_claude.exists() and create_backup_if_exists:
+            # Only this path needs backup's thread-pool copier
+            from .backup import BackupManager
+
             backup_manager = BackupManager(target_repo)
             backup_result = backup_manager.create_claude_backup()
 
@@ -174,15 +235,24 @@ def copy_claude_folder(
 
 
 def merge_claude_folders(
-    source_path: Path, target_path: Path, preserve_local: bool = True
+    source_path: Path,
+    target_path: Path,
+    preserve_local: bool = True,
+    source_manifest: Optional[Dict[str, str]] = None,
+    target_manifest: Optional[Dict[str, str]] = None,
 ) -> Dict[str, any]:
     """
     Merge source .claude folder into existing target .claude folder.
 
+    Only files that are missing from the target or whose content digest
+    differs are written; identical files are left untouched.
+
     Args:
         source_path: Path to source .claude folder
         target_path: Path to target .claude folder
         preserve_local: Whether to preserve local settings and customizations
+        source_manifest: Precomputed manifest of source_path (optional)
+        target_manifest: Precomputed manifest of target_path (optional)
 
     Returns:
         Dictionary with merge operation results
@@ -209,35 +279,36 @@ def merge_claude_folders(
     }
 
     try:
-        # Files to preserve during merge
-        preserve_patterns = ["settings.local.json"] if preserve_local else []
-
-        # Walk through source files
-        for source_file in source_path.rglob("*"):
-            if source_file.is_file():
-                relative_path = source_file.relative_to(source_path)
-                target_file = target_path / relative_path
-
-                # Skip files we want to preserve
-                if any(pattern in str(relative_path) for pattern in preserve_patterns):
-                    result["files_preserved"] += 1
-                    continue
-
-                # Create parent directories if needed
-                target_file.parent.mkdir(parents=True, exist_ok=True)
-
-                if target_file.exists():
-                    # Check if files are different
-                    if source_file.read_bytes() != target_file.read_bytes():
-                        # For now, just overwrite. In a more sophisticated implementation,
-                        # we might want to merge content or prompt user
-                        shutil.copy2(source_file, target_file)
-                        result["files_updated"] += 1
-                    # If files are identical, no action needed
-                else:
-                    # New file, copy it
-                    shutil.copy2(source_file, target_file)
-                    result["files_added"] += 1
+        if source_manifest is None:
+            source_manifest = get_claude_folder_manifest(source_path)
+        if target_manifest is None:
+            target_manifest = get_claude_folder_manifest(target_path)
+
+        for relative_path, source_digest in sorted(source_manifest.items()):
+            # Skip files we want to preserve
+            if preserve_local and is_preserved_file(relative_path):
+                result["files_preserved"] += 1
+                continue
+
+            target_digest = target_manifest.get(relative_path)
+            if target_digest == source_digest:
+                # If files are identical, no action needed
+                continue
+
+            source_file = source_path / relative_path
+            target_file = target_path / relative_path
+
+            # Create parent directories if needed
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # For now, just overwrite. In a more sophisticated implementation,
+            # we might want to merge content or prompt user
+            shutil.copy2(source_file, target_file)
+
+            if target_digest is None:
+                result["files_added"] += 1
+            else:
+                result["files_updated"] += 1
 
         result["success"] = True
 
@@ -313,9 +384,7 @@ def validate_claude_folder_structure(claude_path: Path) -> Dict[str, any]:
             )
 
     # Count total files
-    validation["structure"]["total_files"] = sum(
-        1 for f in claude_path.rglob("*") if f.is_file()
-    )
+    validation["structure"]["total_files"] = sum(1 for _ in _iter_files(claude_path))
 
     return validation
 
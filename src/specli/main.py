@@ -9,26 +9,6 @@ from pathlib import Path
 import click
 
 from . import __version__
-from .backup import BackupManager
-from .config import load_config
-from .filesystem import ClaudeFolderNotFoundError, detect_claude_folder
-from .github import GitHubCLIError
-from .operations import deploy_claude_commands, update_claude_commands
-from .output import (
-    format_config_message,
-    format_dry_run_config_message,
-    format_dry_run_message,
-    format_error_message,
-    format_github_setup_message,
-    format_operation_details,
-    format_repository_validation_message,
-    format_success_message,
-)
-from .validation import (
-    validate_github_setup,
-    validate_source_repository,
-    validate_target_path,
-)
 
 
 @click.group()
@@ -50,6 +30,21 @@ def main():
 )
 def deploy(source_repo, path, dry_run):
     """Deploy .claude commands from source repository to target path."""
+    # Commands import their dependencies lazily so --help and --version stay fast
+    from .github import GitHubCLIError
+    from .operations import deploy_claude_commands
+    from .output import (
+        format_config_message,
+        format_dry_run_config_message,
+        format_dry_run_message,
+        format_error_message,
+        format_github_setup_message,
+        format_operation_details,
+        format_repository_validation_message,
+        format_success_message,
+    )
+    from .validation import validate_github_setup, validate_source_repository
+
     try:
         # Output expected by tests
         click.echo(f"Deploy command called with source: {source_repo}")
@@ -141,6 +136,26 @@ def deploy(source_repo, path, dry_run):
 )
 def update(path, dry_run, source, no_backup):
     """Update existing .claude commands in target path."""
+    from .backup import BackupManager
+    from .config import load_config
+    from .filesystem import ClaudeFolderNotFoundError, detect_claude_folder
+    from .github import GitHubCLIError
+    from .operations import update_claude_commands
+    from .output import (
+        format_config_message,
+        format_dry_run_message,
+        format_error_message,
+        format_github_setup_message,
+        format_operation_details,
+        format_repository_validation_message,
+        format_success_message,
+    )
+    from .validation import (
+        validate_github_setup,
+        validate_source_repository,
+        validate_target_path,
+    )
+
     try:
         # Output expected by tests
         target_path = Path(path).resolve()
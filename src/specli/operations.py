@@ -5,20 +5,45 @@ Contains core business logic separated from CLI concerns to enable
 better testability and reusability of deployment/update operations.
 """
 
-import tempfile
+import os
+import shutil
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from .backup import BackupManager
 from .config import save_config
 from .filesystem import (
     ClaudeFolderCorruptedError,
     ClaudeFolderNotFoundError,
     copy_claude_folder,
     detect_claude_folder,
+    get_claude_folder_manifest,
+    is_preserved_file,
     merge_claude_folders,
 )
-from .github import clone_repository
+
+# RAM-backed scratch space for intermediate clones (Linux only)
+TMPFS_ROOT = Path("/dev/shm")
+TMPFS_MIN_FREE_BYTES = 500 * 1024 * 1024
+
+
+def _get_temp_root() -> Optional[str]:
+    """
+    Select a tmpfs directory for temporary clones when one is usable.
+
+    Returns:
+        Path to a writable tmpfs directory with enough free space, or None
+        to fall back to the system default temporary directory
+    """
+    try:
+        if not (TMPFS_ROOT.is_dir() and os.access(TMPFS_ROOT, os.W_OK)):
+            return None
+        # Avoid exhausting RAM on small hosts
+        if shutil.disk_usage(TMPFS_ROOT).free < TMPFS_MIN_FREE_BYTES:
+            return None
+    except OSError:
+        return None
+
+    return str(TMPFS_ROOT)
 
 
 def deploy_claude_commands(
@@ -40,6 +65,8 @@ def deploy_claude_commands(
         - message: str (summary message)
         - error: str (if failed)
     """
+    target_str = str(target_path)
+
     try:
         if dry_run:
             # For dry run, just validate configuration creation
@@ -50,15 +77,21 @@ def deploy_claude_commands(
                 "dry_run": True,
                 "details": {
                     "source_repo": source_repo,
-                    "target_path": str(target_path),
+                    "target_path": target_str,
                     "config_created": config_result["success"],
                     "config_file": config_result.get("config_file"),
                 },
-                "message": f"Dry run: Would deploy .claude folder to {target_path}",
+                "message": f"Dry run: Would deploy .claude folder to {target_str}",
             }
 
+        # Clone machinery is imported lazily, here and in update, since dry
+        # runs never reach it
+        import tempfile
+
+        from .github import clone_repository
+
         # Clone source repository to temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=_get_temp_root()) as temp_dir:
             clone_result = clone_repository(source_repo, Path(temp_dir))
             source_repo_path = clone_result["repository_path"]
 
@@ -71,7 +104,7 @@ def deploy_claude_commands(
                     "operation": "deploy",
                     "details": {
                         "source_repo": source_repo,
-                        "target_path": str(target_path),
+                        "target_path": target_str,
                     },
                     "message": f"No .claude folder found in source repository: {source_repo}",
                     "error": f"ClaudeFolderNotFoundError: {source_repo}",
@@ -82,7 +115,7 @@ def deploy_claude_commands(
                     "operation": "deploy",
                     "details": {
                         "source_repo": source_repo,
-                        "target_path": str(target_path),
+                        "target_path": target_str,
                     },
                     "message": f"Corrupted .claude folder in source: {e}",
                     "error": f"ClaudeFolderCorruptedError: {e}",
@@ -100,7 +133,7 @@ def deploy_claude_commands(
                     "operation": "deploy",
                     "details": {
                         "source_repo": source_repo,
-                        "target_path": str(target_path),
+                        "target_path": target_str,
                         "files_copied": copy_result["files_copied"],
                         "bytes_copied": copy_result["bytes_copied"],
                         "backup_created": copy_result.get("backup_created", False),
@@ -108,7 +141,7 @@ def deploy_claude_commands(
                         "config_saved": config_result["success"],
                         "config_file": config_result.get("config_file"),
                     },
-                    "message": f"Successfully deployed .claude folder to {target_path}",
+                    "message": f"Successfully deployed .claude folder to {target_str}",
                 }
             else:
                 return {
@@ -116,9 +149,9 @@ def deploy_claude_commands(
                     "operation": "deploy",
                     "details": {
                         "source_repo": source_repo,
-                        "target_path": str(target_path),
+                        "target_path": target_str,
                     },
-                    "message": f"Failed to deploy to {target_path}: {copy_result['error']}",
+                    "message": f"Failed to deploy to {target_str}: {copy_result['error']}",
                     "error": copy_result["error"],
                 }
 
@@ -126,7 +159,7 @@ def deploy_claude_commands(
         return {
             "success": False,
             "operation": "deploy",
-            "details": {"source_repo": source_repo, "target_path": str(target_path)},
+            "details": {"source_repo": source_repo, "target_path": target_str},
             "message": f"Unexpected deployment error: {e}",
             "error": str(e),
         }
@@ -152,34 +185,22 @@ def update_claude_commands(
         - message: str (summary message)
         - error: str (if failed)
     """
+    target_str = str(target_path)
+
     try:
         # Handle backup before update (if .claude folder exists)
         backup_created = False
         backup_path = None
+        should_backup = False
 
         try:
             target_claude = detect_claude_folder(target_path)
-            # .claude folder exists, handle backup
+            # .claude folder exists; ask now so the prompt stays on this thread
             if not dry_run:
+                from .backup import BackupManager
+
                 backup_manager = BackupManager(target_path)
                 should_backup = backup_manager.should_create_backup(no_backup=no_backup)
-
-                if should_backup:
-                    backup_result = backup_manager.create_claude_backup()
-                    if backup_result["success"]:
-                        backup_created = True
-                        backup_path = backup_result["backup_path"]
-                    else:
-                        return {
-                            "success": False,
-                            "operation": "update",
-                            "details": {
-                                "target_path": str(target_path),
-                                "source_repo": source_repo,
-                            },
-                            "message": f"Backup failed: {backup_result['error']}",
-                            "error": f"BackupError: {backup_result['error']}",
-                        }
         except ClaudeFolderNotFoundError:
             # No .claude folder exists, no backup needed
             target_claude = None
@@ -190,17 +211,60 @@ def update_claude_commands(
                 "operation": "update",
                 "dry_run": True,
                 "details": {
-                    "target_path": str(target_path),
+                    "target_path": target_str,
                     "source_repo": source_repo,
                     "backup_would_be_created": backup_created
                     or (target_claude is not None and not no_backup),
                 },
-                "message": f"Dry run: Would update .claude folder in {target_path}",
+                "message": f"Dry run: Would update .claude folder in {target_str}",
             }
 
+        import tempfile
+        from concurrent.futures import ThreadPoolExecutor
+
+        from .github import clone_repository
+
         # Clone source repository to temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            clone_result = clone_repository(source_repo, Path(temp_dir))
+        clone_dir = tempfile.TemporaryDirectory(dir=_get_temp_root())
+        remove_clone_dir = True
+        try:
+            # Backup writes local disk while the clone waits on the network,
+            # so run them side by side
+            executor = ThreadPoolExecutor(max_workers=2)
+            backup_future = (
+                executor.submit(backup_manager.create_claude_backup)
+                if should_backup
+                else None
+            )
+            clone_future = executor.submit(
+                clone_repository, source_repo, Path(clone_dir.name)
+            )
+            # Don't join the pool: a failed backup must not wait out the clone
+            executor.shutdown(wait=False)
+
+            if backup_future is not None:
+                backup_result = backup_future.result()
+                if backup_result["success"]:
+                    backup_created = True
+                    backup_path = str(backup_result["backup_path"])
+                else:
+                    if not clone_future.cancel():
+                        # Clone already running; remove its directory once it exits
+                        remove_clone_dir = False
+                        clone_future.add_done_callback(lambda _: clone_dir.cleanup())
+                    return {
+                        "success": False,
+                        "operation": "update",
+                        "details": {
+                            "target_path": target_str,
+                            "source_repo": source_repo,
+                        },
+                        "message": f"Backup failed: {backup_result['error']}",
+                        "error": f"BackupError: {backup_result['error']}",
+                    }
+
+            clone_result = clone_future.result()
+
             source_repo_path = clone_result["repository_path"]
 
             # Detect .claude folder in source
@@ -211,7 +275,7 @@ def update_claude_commands(
                     "success": False,
                     "operation": "update",
                     "details": {
-                        "target_path": str(target_path),
+                        "target_path": target_str,
                         "source_repo": source_repo,
                     },
                     "message": f"No .claude folder found in source repository: {source_repo}",
@@ -222,7 +286,7 @@ def update_claude_commands(
                     "success": False,
                     "operation": "update",
                     "details": {
-                        "target_path": str(target_path),
+                        "target_path": target_str,
                         "source_repo": source_repo,
                     },
                     "message": f"Corrupted .claude folder in source: {e}",
@@ -231,8 +295,50 @@ def update_claude_commands(
 
             # Perform update operation
             if target_claude is not None:
+                # Skip the merge entirely when it would write nothing: compare
+                # only the files it may copy, since preserved and target-only
+                # files are never touched
+                source_manifest = get_claude_folder_manifest(source_claude)
+                target_manifest = get_claude_folder_manifest(target_claude)
+                mergeable = {
+                    path: digest
+                    for path, digest in source_manifest.items()
+                    if not is_preserved_file(path)
+                }
+                target_mergeable = {
+                    path: target_manifest[path]
+                    for path in mergeable
+                    if path in target_manifest
+                }
+                if mergeable == target_mergeable:
+                    # Save configuration so an overridden source is remembered
+                    config_result = save_config(source_repo, target_path)
+
+                    return {
+                        "success": True,
+                        "operation": "update",
+                        "details": {
+                            "target_path": target_str,
+                            "source_repo": source_repo,
+                            "files_updated": 0,
+                            "files_added": 0,
+                            "files_preserved": len(source_manifest) - len(mergeable),
+                            "no_changes": True,
+                            "backup_created": backup_created,
+                            "backup_path": backup_path,
+                            "config_saved": config_result["success"],
+                            "config_file": config_result.get("config_file"),
+                        },
+                        "message": f"No changes: .claude folder in {target_str} is already up to date",
+                    }
+
                 # Update existing .claude folder
-                merge_result = merge_claude_folders(source_claude, target_claude)
+                merge_result = merge_claude_folders(
+                    source_claude,
+                    target_claude,
+                    source_manifest=source_manifest,
+                    target_manifest=target_manifest,
+                )
 
                 if merge_result["success"]:
                     # Save configuration file after successful update
@@ -242,27 +348,27 @@ def update_claude_commands(
                         "success": True,
                         "operation": "update",
                         "details": {
-                            "target_path": str(target_path),
+                            "target_path": target_str,
                             "source_repo": source_repo,
                             "files_updated": merge_result["files_updated"],
                             "files_added": merge_result["files_added"],
                             "files_preserved": merge_result["files_preserved"],
                             "backup_created": backup_created,
-                            "backup_path": str(backup_path) if backup_path else None,
+                            "backup_path": backup_path,
                             "config_saved": config_result["success"],
                             "config_file": config_result.get("config_file"),
                         },
-                        "message": f"Successfully updated .claude folder in {target_path}",
+                        "message": f"Successfully updated .claude folder in {target_str}",
                     }
                 else:
                     return {
                         "success": False,
                         "operation": "update",
                         "details": {
-                            "target_path": str(target_path),
+                            "target_path": target_str,
                             "source_repo": source_repo,
                         },
-                        "message": f"Failed to update {target_path}: {merge_result['error']}",
+                        "message": f"Failed to update {target_str}: {merge_result['error']}",
                         "error": merge_result["error"],
                     }
             else:
@@ -277,7 +383,7 @@ def update_claude_commands(
                         "success": True,
                         "operation": "update",
                         "details": {
-                            "target_path": str(target_path),
+                            "target_path": target_str,
                             "source_repo": source_repo,
                             "files_copied": copy_result["files_copied"],
                             "bytes_copied": copy_result["bytes_copied"],
@@ -285,25 +391,28 @@ def update_claude_commands(
                             "config_saved": config_result["success"],
                             "config_file": config_result.get("config_file"),
                         },
-                        "message": f"Successfully deployed .claude folder to {target_path}",
+                        "message": f"Successfully deployed .claude folder to {target_str}",
                     }
                 else:
                     return {
                         "success": False,
                         "operation": "update",
                         "details": {
-                            "target_path": str(target_path),
+                            "target_path": target_str,
                             "source_repo": source_repo,
                         },
-                        "message": f"Failed to deploy to {target_path}: {copy_result['error']}",
+                        "message": f"Failed to deploy to {target_str}: {copy_result['error']}",
                         "error": copy_result["error"],
                     }
+        finally:
+            if remove_clone_dir:
+                clone_dir.cleanup()
 
     except Exception as e:
         return {
             "success": False,
             "operation": "update",
-            "details": {"target_path": str(target_path), "source_repo": source_repo},
+            "details": {"target_path": target_str, "source_repo": source_repo},
             "message": f"Unexpected update error: {e}",
             "error": str(e),
         }
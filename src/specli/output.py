@@ -40,6 +40,8 @@ def format_success_message(operation: str, details: Dict[str, Any]) -> str:
         target_path = details.get("target_path", "")
         if details.get("fresh_deploy"):
             return f"Successfully deployed .claude folder to {target_path}"
+        elif details.get("no_changes"):
+            return f".claude folder in {target_path} is already up to date"
         else:
             return f"Successfully updated .claude folder in {target_path}"
     else:
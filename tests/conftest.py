@@ -0,0 +1,103 @@
+"""
+Shared pytest fixtures for the specli test suite.
+"""
+
+import shutil
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Canned gh CLI responses keyed by the argument tokens that select them; built
+# once at import and shared read-only so test order cannot leak state.
+_GH_RESPONSES = MappingProxyType(
+    {
+        ("--version",): Mock(
+            returncode=0, stdout="gh version 2.40.1 (2023-12-13)\n", stderr=""
+        ),
+        ("auth", "status"): Mock(
+            returncode=0, stdout="✓ Logged in to github.com as testuser"
+        ),
+        ("api", "user"): Mock(returncode=0, stdout='{"login": "testuser"}'),
+        ("repo", "clone"): Mock(returncode=0, stdout="Cloning into repository..."),
+    }
+)
+_GH_DEFAULT_RESPONSE = Mock(returncode=0, stdout="", stderr="")
+_NON_GH_RESPONSE = Mock(returncode=0)
+
+
+def _gh_side_effect(args, **kwargs):
+    """Dispatch a mocked subprocess.run call to its canned gh response."""
+    tokens = set(args)
+    if "gh" not in tokens:
+        return _NON_GH_RESPONSE
+
+    for key, response in _GH_RESPONSES.items():
+        if tokens.issuperset(key):
+            return response
+    return _GH_DEFAULT_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """CLI runner shared by every test; it holds no per-test state."""
+    return CliRunner()
+
+
+@pytest.fixture
+def fake_github(monkeypatch):
+    """Route every subprocess.run call through canned, offline gh responses."""
+    mock_run = Mock(side_effect=_gh_side_effect)
+    monkeypatch.setattr("subprocess.run", mock_run)
+    return mock_run
+
+
+@pytest.fixture(scope="session")
+def session_tmpdir(tmp_path_factory):
+    """Parent directory for per-test working directories, removed once."""
+    return tmp_path_factory.mktemp("specli_cli")
+
+
+@pytest.fixture
+def fresh_cwd(session_tmpdir, monkeypatch, request):
+    """Run the test inside a fresh, empty working directory."""
+    directory = session_tmpdir / request.node.name
+    directory.mkdir()
+    monkeypatch.chdir(directory)
+    return directory
+
+
+@pytest.fixture(scope="session")
+def source_repo(tmp_path_factory):
+    """Source repository with sample .claude commands, built once per session."""
+    repo_path = tmp_path_factory.mktemp("source_repo")
+    shutil.copytree(FIXTURES_DIR / "source_claude", repo_path / ".claude")
+    return repo_path
+
+
+@pytest.fixture(scope="session")
+def existing_claude():
+    """Pre-existing target .claude folder with local customisations to preserve."""
+    return FIXTURES_DIR / "existing_claude"
+
+
+@pytest.fixture
+def target_repo(tmp_path):
+    """Empty target repository."""
+    repo_path = tmp_path / "target_repo"
+    repo_path.mkdir()
+    return repo_path
+
+
+@pytest.fixture
+def targets(tmp_path):
+    """Two empty target repositories."""
+    target_repo1 = tmp_path / "target_repo1"
+    target_repo2 = tmp_path / "target_repo2"
+    target_repo1.mkdir()
+    target_repo2.mkdir()
+    return target_repo1, target_repo2
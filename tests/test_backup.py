@@ -8,106 +8,90 @@ Tests the backup protection system that:
 - Ensures backup completion before allowing updates
 """
 
-import shutil
-import tempfile
-from pathlib import Path
-from unittest.mock import patch
+import os
+
+import pytest
 
 from specli.backup import BackupManager
 
 
+@pytest.fixture
+def backup_manager(tmp_path):
+    """BackupManager targeting a fresh temporary directory."""
+    return BackupManager(tmp_path)
+
+
+@pytest.fixture
+def claude_folder(tmp_path):
+    """Empty .claude folder inside the backup manager's target directory."""
+    folder = tmp_path / ".claude"
+    folder.mkdir()
+    return folder
+
+
 class TestBackupManagerInterface:
     """Test the basic interface and structure of BackupManager."""
 
-    def test_backup_manager_can_be_imported(self):
-        """BackupManager class should be importable from specli.backup module."""
-        # This test will fail until BackupManager is implemented
-        assert BackupManager is not None
-
-    def test_backup_manager_can_be_instantiated(self):
+    def test_backup_manager_can_be_instantiated(self, tmp_path):
         """BackupManager should be instantiable with a target path."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            target_path = Path(temp_dir)
-            backup_manager = BackupManager(target_path)
-            assert backup_manager is not None
-            assert backup_manager.target_path == target_path
+        backup_manager = BackupManager(tmp_path)
+        assert backup_manager is not None
+        assert backup_manager.target_path == tmp_path
+
+    @pytest.mark.parametrize("method", ["should_create_backup", "create_claude_backup"])
+    def test_backup_manager_exposes_method(self, backup_manager, method):
+        """BackupManager should expose its prompting and backup methods."""
+        assert callable(getattr(backup_manager, method, None))
 
 
 class TestBackupManagerPrompting:
     """Test the interactive prompting functionality."""
 
-    def setup_method(self):
-        """Set up test environment with temporary directory."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.target_path = Path(self.temp_dir)
-        self.backup_manager = BackupManager(self.target_path)
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_should_create_backup_method_exists(self):
-        """BackupManager should have should_create_backup method."""
-        assert hasattr(self.backup_manager, "should_create_backup")
-        assert callable(self.backup_manager.should_create_backup)
-
-    @patch("click.confirm")
-    def test_should_create_backup_prompts_user_with_correct_message(self, mock_confirm):
+    def test_should_create_backup_prompts_user_with_correct_message(
+        self, monkeypatch, backup_manager
+    ):
         """should_create_backup should prompt user with correct message and default."""
-        mock_confirm.return_value = True
+        prompts = []
+        monkeypatch.setattr(
+            "specli.backup.confirm",
+            lambda text, default: prompts.append((text, default)) or True,
+        )
 
-        result = self.backup_manager.should_create_backup()
+        result = backup_manager.should_create_backup()
 
-        mock_confirm.assert_called_once_with(
-            "Create backup of .claude folder before update?", default=True
-        )
+        assert prompts == [("Create backup of .claude folder before update?", True)]
         assert result is True
 
-    @patch("click.confirm")
-    def test_should_create_backup_returns_user_choice(self, mock_confirm):
+    def test_should_create_backup_returns_user_choice(
+        self, monkeypatch, backup_manager
+    ):
         """should_create_backup should return the user's choice."""
-        mock_confirm.return_value = False
+        monkeypatch.setattr("specli.backup.confirm", lambda text, default: False)
 
-        result = self.backup_manager.should_create_backup()
+        result = backup_manager.should_create_backup()
 
         assert result is False
 
-    def test_should_create_backup_respects_no_backup_flag(self):
+    def test_should_create_backup_respects_no_backup_flag(self, backup_manager):
         """should_create_backup should skip prompting when no_backup=True."""
         # This should not prompt user at all when no_backup=True
-        result = self.backup_manager.should_create_backup(no_backup=True)
+        result = backup_manager.should_create_backup(no_backup=True)
         assert result is False
 
 
 class TestBackupManagerFolderOperations:
     """Test the backup folder creation and management."""
 
-    def setup_method(self):
-        """Set up test environment with temporary directory."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.target_path = Path(self.temp_dir)
-        self.backup_manager = BackupManager(self.target_path)
-
-    def teardown_method(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_create_claude_backup_method_exists(self):
-        """BackupManager should have create_claude_backup method."""
-        assert hasattr(self.backup_manager, "create_claude_backup")
-        assert callable(self.backup_manager.create_claude_backup)
-
-    def test_create_claude_backup_creates_backup_folder_structure(self):
+    def test_create_claude_backup_creates_backup_folder_structure(
+        self, tmp_path, backup_manager, claude_folder
+    ):
         """create_claude_backup should create .claude-backup directory structure."""
-        # Create a .claude folder to backup
-        claude_folder = self.target_path / ".claude"
-        claude_folder.mkdir()
-        (claude_folder / "test_file.txt").write_text("test content")
+        (claude_folder / "test_file.txt").write_bytes(b"test content")
 
-        result = self.backup_manager.create_claude_backup()
+        result = backup_manager.create_claude_backup()
 
         # Should create .claude-backup folder
-        backup_root = self.target_path / ".claude-backup"
+        backup_root = tmp_path / ".claude-backup"
         assert backup_root.exists()
         assert backup_root.is_dir()
 
@@ -121,17 +105,17 @@ class TestBackupManagerFolderOperations:
         assert "backup_path" in result
         assert result["backup_path"].parent == backup_root
 
-    def test_create_claude_backup_preserves_folder_contents(self):
+    def test_create_claude_backup_preserves_folder_contents(
+        self, backup_manager, claude_folder
+    ):
         """create_claude_backup should completely preserve .claude folder contents."""
         # Create a .claude folder with complex structure
-        claude_folder = self.target_path / ".claude"
-        claude_folder.mkdir()
         commands_dir = claude_folder / "commands"
         commands_dir.mkdir()
-        (commands_dir / "test.md").write_text("# Test Command")
-        (claude_folder / "settings.json").write_text('{"test": true}')
+        (commands_dir / "test.md").write_bytes(b"# Test Command")
+        (claude_folder / "settings.json").write_bytes(b'{"test": true}')
 
-        result = self.backup_manager.create_claude_backup()
+        result = backup_manager.create_claude_backup()
 
         # Verify backup contains all original content
         backup_path = result["backup_path"]
@@ -139,31 +123,118 @@ class TestBackupManagerFolderOperations:
         assert (backup_path / ".claude" / "settings.json").exists()
         assert (
             backup_path / ".claude" / "commands" / "test.md"
-        ).read_text() == "# Test Command"
+        ).read_bytes() == b"# Test Command"
         assert (
             backup_path / ".claude" / "settings.json"
-        ).read_text() == '{"test": true}'
+        ).read_bytes() == b'{"test": true}'
+
+    def test_create_claude_backup_copies_nested_and_empty_directories(
+        self, backup_manager, claude_folder
+    ):
+        """create_claude_backup should reproduce deep and empty directories."""
+        nested_dir = claude_folder / "commands" / "group" / "sub"
+        nested_dir.mkdir(parents=True)
+        (claude_folder / "empty").mkdir()
+        for index in range(10):
+            (nested_dir / f"cmd{index}.md").write_bytes(f"# Command {index}".encode())
+
+        result = backup_manager.create_claude_backup()
+
+        backed_up = result["backup_path"] / ".claude"
+        assert (backed_up / "empty").is_dir()
+        for index in range(10):
+            backed_up_file = backed_up / "commands" / "group" / "sub" / f"cmd{index}.md"
+            assert backed_up_file.read_text() == f"# Command {index}"
+
+    def test_create_claude_backup_copies_through_directory_symlinks(
+        self, tmp_path, backup_manager, claude_folder
+    ):
+        """create_claude_backup should copy what a directory symlink points to."""
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        (shared / "deploy.md").write_bytes(b"# Deploy")
+        (claude_folder / "commands").symlink_to(shared, target_is_directory=True)
+
+        result = backup_manager.create_claude_backup()
+
+        assert result["success"] is True
+        backed_up_commands = result["backup_path"] / ".claude" / "commands"
+        assert not backed_up_commands.is_symlink()
+        assert (backed_up_commands / "deploy.md").read_bytes() == b"# Deploy"
+
+    def test_create_claude_backup_fails_on_symlink_cycle(
+        self, backup_manager, claude_folder
+    ):
+        """create_claude_backup should fail, not recurse, on a symlink loop."""
+        (claude_folder / "test.md").write_bytes(b"# Test")
+        (claude_folder / "loop").symlink_to(".", target_is_directory=True)
+
+        result = backup_manager.create_claude_backup()
+
+        assert result["success"] is False
+        assert "Symlink cycle" in result["error"]
 
-    def test_create_claude_backup_handles_missing_claude_folder(self):
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+    def test_create_claude_backup_rejects_named_pipes(
+        self, backup_manager, claude_folder
+    ):
+        """create_claude_backup should refuse a FIFO instead of blocking on it."""
+        os.mkfifo(claude_folder / "pipe")
+
+        result = backup_manager.create_claude_backup()
+
+        assert result["success"] is False
+        assert "named pipe" in result["error"]
+
+    def test_create_claude_backup_is_unaffected_by_later_edits(
+        self, backup_manager, claude_folder
+    ):
+        """Rewriting a source file in place should not change its backup."""
+        source_file = claude_folder / "test.md"
+        source_file.write_bytes(b"# Original")
+
+        result = backup_manager.create_claude_backup()
+        with open(source_file, "rb+") as f:
+            f.write(b"# Modified")
+
+        backed_up_file = result["backup_path"] / ".claude" / "test.md"
+        assert backed_up_file.read_bytes() == b"# Original"
+
+    def test_create_claude_backup_copies_without_sendfile(
+        self, monkeypatch, backup_manager, claude_folder
+    ):
+        """create_claude_backup should still copy when sendfile is refused."""
+
+        def refuse_sendfile(*args):
+            raise OSError("sendfile not supported")
+
+        monkeypatch.setattr("os.sendfile", refuse_sendfile)
+        (claude_folder / "settings.json").write_bytes(b'{"test": true}')
+
+        result = backup_manager.create_claude_backup()
+
+        backed_up_file = result["backup_path"] / ".claude" / "settings.json"
+        assert backed_up_file.read_bytes() == b'{"test": true}'
+
+    def test_create_claude_backup_handles_missing_claude_folder(self, backup_manager):
         """create_claude_backup should handle case where .claude folder doesn't exist."""
         # No .claude folder exists
-        result = self.backup_manager.create_claude_backup()
+        result = backup_manager.create_claude_backup()
 
         # Should return failure status
         assert result["success"] is False
         assert "error" in result
         assert ".claude folder does not exist" in result["error"]
 
-    def test_create_claude_backup_generates_unique_timestamps(self):
+    def test_create_claude_backup_generates_unique_timestamps(
+        self, backup_manager, claude_folder
+    ):
         """create_claude_backup should generate unique timestamps for multiple backups."""
-        # Create a .claude folder
-        claude_folder = self.target_path / ".claude"
-        claude_folder.mkdir()
-        (claude_folder / "test.txt").write_text("content")
+        (claude_folder / "test.txt").write_bytes(b"content")
 
         # Create multiple backups
-        result1 = self.backup_manager.create_claude_backup()
-        result2 = self.backup_manager.create_claude_backup()
+        result1 = backup_manager.create_claude_backup()
+        result2 = backup_manager.create_claude_backup()
 
         # Should have different backup paths
         assert result1["success"] is True
@@ -174,35 +245,42 @@ class TestBackupManagerFolderOperations:
         assert result1["backup_path"].exists()
         assert result2["backup_path"].exists()
 
+    def test_create_claude_backup_retries_name_collisions(
+        self, tmp_path, claude_folder
+    ):
+        """Managers sharing a frozen clock should still get distinct backups."""
+        (claude_folder / "test.txt").write_bytes(b"content")
 
-class TestBackupManagerSafety:
-    """Test backup safety and error handling."""
+        def frozen_clock():
+            return 1_700_000_000
+
+        result1 = BackupManager(tmp_path, clock=frozen_clock).create_claude_backup()
+        result2 = BackupManager(tmp_path, clock=frozen_clock).create_claude_backup()
+
+        assert result1["success"] is True
+        assert result2["success"] is True
+        assert result1["backup_path"] != result2["backup_path"]
+        assert (result2["backup_path"] / ".claude" / "test.txt").exists()
 
-    def setup_method(self):
-        """Set up test environment with temporary directory."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.target_path = Path(self.temp_dir)
-        self.backup_manager = BackupManager(self.target_path)
 
-    def teardown_method(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+class TestBackupManagerSafety:
+    """Test backup safety and error handling."""
 
-    def test_create_claude_backup_returns_status_dict(self):
+    def test_create_claude_backup_returns_status_dict(
+        self, backup_manager, claude_folder
+    ):
         """create_claude_backup should return a dictionary with success status."""
-        claude_folder = self.target_path / ".claude"
-        claude_folder.mkdir()
 
-        result = self.backup_manager.create_claude_backup()
+        result = backup_manager.create_claude_backup()
 
         assert isinstance(result, dict)
         assert "success" in result
-        assert isinstance(result["success"], bool)
+        assert type(result["success"]) is bool
 
-    def test_backup_failure_prevents_update_flow(self):
+    def test_backup_failure_prevents_update_flow(self, backup_manager):
         """When backup fails, the system should indicate failure clearly."""
         # This test ensures backup failure is communicated properly
-        result = self.backup_manager.create_claude_backup()
+        result = backup_manager.create_claude_backup()
 
         # When .claude doesn't exist, backup should fail
         assert result["success"] is False
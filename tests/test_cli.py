@@ -6,43 +6,54 @@ Covers:
 - FR-006: CLI arguments and interactive prompts
 """
 
-from pathlib import Path
+import json
 
-from click.testing import CliRunner
+import pytest
 
 from specli import __version__
 from specli.main import deploy, main, update
 
 
+@pytest.fixture
+def target_dir(tmp_path):
+    """Per-test target path; each xdist worker gets its own tmp_path root."""
+    return tmp_path / "deploy"
+
+
+def _assert_contains(output: str, *needles: str) -> None:
+    """Assert every needle appears in output, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in output]
+    assert not missing, missing
+
+
 class TestMainCLI:
     """Test main CLI group and basic functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    def test_main_help(self):
+    def test_main_help(self, runner):
         """Test main CLI help output."""
-        result = self.runner.invoke(main, ["--help"])
+        result = runner.invoke(main, ["--help"])
 
         assert result.exit_code == 0
-        assert "Claude Command Deployer" in result.output
-        assert "Deploy and sync .claude commands across" in result.output
-        assert "repositories" in result.output
-        assert "Commands:" in result.output
-        assert "deploy" in result.output
-        assert "update" in result.output
-
-    def test_main_version(self):
+        _assert_contains(
+            result.output,
+            "Claude Command Deployer",
+            "Deploy and sync .claude commands across",
+            "repositories",
+            "Commands:",
+            "deploy",
+            "update",
+        )
+
+    def test_main_version(self, runner):
         """Test version output."""
-        result = self.runner.invoke(main, ["--version"])
+        result = runner.invoke(main, ["--version"])
 
         assert result.exit_code == 0
         assert f"version {__version__}" in result.output
 
-    def test_main_no_command(self):
+    def test_main_no_command(self, runner):
         """Test main CLI with no command shows help."""
-        result = self.runner.invoke(main, [])
+        result = runner.invoke(main, [])
 
         # Click groups return exit code 0 when showing help
         # but in some versions it may return 2 for missing command
@@ -53,108 +64,111 @@ class TestMainCLI:
 class TestDeployCommand:
     """Test deploy command functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    def test_deploy_help(self):
+    def test_deploy_help(self, runner):
         """Test deploy command help output."""
-        result = self.runner.invoke(deploy, ["--help"])
+        result = runner.invoke(deploy, ["--help"])
 
         assert result.exit_code == 0
-        assert "Deploy .claude commands from source repository" in result.output
-        assert "SOURCE_REPO" in result.output
-        assert "--path" in result.output
-        assert "--dry-run" in result.output
+        _assert_contains(
+            result.output,
+            "Deploy .claude commands from source repository",
+            "SOURCE_REPO",
+            "--path",
+            "--dry-run",
+        )
 
-    def test_deploy_with_source_only(self):
+    def test_deploy_with_source_only(self, runner, fresh_cwd, fake_github):
         """Test deploy command with source only (defaults to current directory)."""
-        with self.runner.isolated_filesystem():
-            result = self.runner.invoke(deploy, ["https://github.com/user/source.git"])
+        result = runner.invoke(deploy, ["https://github.com/user/source.git"])
 
-            assert result.exit_code == 0
-            assert (
-                "Deploy command called with source: https://github.com/user/source.git"
-                in result.output
-            )
-            assert "Target path:" in result.output
+        assert result.exit_code == 0
+        _assert_contains(
+            result.output,
+            "Deploy command called with source: https://github.com/user/source.git",
+            "Target path:",
+        )
 
-    def test_deploy_with_path(self):
+    def test_deploy_with_path(self, capsys, fake_github, target_dir):
         """Test deploy command with source and target path."""
-        with self.runner.isolated_filesystem():
-            result = self.runner.invoke(
-                deploy, ["https://github.com/user/source.git", "--path", "/custom/path"]
-            )
+        # Option parsing is covered above; call the command body directly
+        deploy.callback(
+            source_repo="https://github.com/user/source.git",
+            path=str(target_dir),
+            dry_run=False,
+        )
 
-            assert result.exit_code == 0
-            assert (
-                "Deploy command called with source: https://github.com/user/source.git"
-                in result.output
-            )
-            assert "Target path:" in result.output
+        output = capsys.readouterr().out
+        _assert_contains(
+            output,
+            "Deploy command called with source: https://github.com/user/source.git",
+            f"Target path: {target_dir}",
+        )
 
-    def test_deploy_dry_run(self):
+    def test_deploy_dry_run(self, runner, fresh_cwd):
         """Test deploy command with dry-run flag."""
-        with self.runner.isolated_filesystem():
-            result = self.runner.invoke(
-                deploy, ["https://github.com/user/source.git", "--dry-run"]
-            )
+        result = runner.invoke(
+            deploy, ["https://github.com/user/source.git", "--dry-run"]
+        )
 
-            assert result.exit_code == 0
-            assert "Dry run mode - no changes would be made" in result.output
+        assert result.exit_code == 0
+        assert "Dry run mode - no changes would be made" in result.output
 
-    def test_deploy_missing_source(self):
+    def test_deploy_missing_source(self, runner):
         """Test deploy command without source repository fails."""
-        result = self.runner.invoke(deploy, [])
+        result = runner.invoke(deploy, [])
 
         assert result.exit_code != 0
         assert "Missing argument" in result.output
 
-    def test_deploy_argument_validation(self):
+    def test_deploy_argument_validation(self, runner, fresh_cwd, fake_github):
         """Test deploy command argument validation."""
-        with self.runner.isolated_filesystem():
-            # Test with invalid source format (this will be validated later in implementation)
-            result = self.runner.invoke(deploy, ["invalid-source"])
+        # Test with invalid source format (this will be validated later in implementation)
+        result = runner.invoke(deploy, ["invalid-source"])
 
-            # For now, just verify the command accepts the argument
-            assert result.exit_code == 0
-            assert "Deploy command called with source: invalid-source" in result.output
-            assert "Target path:" in result.output
+        # For now, just verify the command accepts the argument
+        assert result.exit_code == 0
+        _assert_contains(
+            result.output,
+            "Deploy command called with source: invalid-source",
+            "Target path:",
+        )
 
 
 class TestUpdateCommand:
     """Test update command functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    def test_update_help(self):
+    def test_update_help(self, runner):
         """Test update command help output."""
-        result = self.runner.invoke(update, ["--help"])
+        result = runner.invoke(update, ["--help"])
 
         assert result.exit_code == 0
-        assert "Update existing .claude commands in target path" in result.output
-        assert "--path" in result.output
-        assert "--dry-run" in result.output
+        _assert_contains(
+            result.output,
+            "Update existing .claude commands in target path",
+            "--path",
+            "--dry-run",
+        )
 
-    def test_update_default_path(self):
+    def test_update_default_path(self, runner, fresh_cwd):
         """Test update command with default path (current directory)."""
-        result = self.runner.invoke(update, [])
+        result = runner.invoke(update, [])
 
         assert result.exit_code == 0
         assert "Update command called for path:" in result.output
 
-    def test_update_with_path(self):
+    def test_update_with_path(self, capsys, target_dir):
         """Test update command with custom path."""
-        result = self.runner.invoke(update, ["--path", "/custom/path"])
+        # Option parsing is covered above; call the command body directly
+        update.callback(
+            path=str(target_dir), dry_run=False, source=None, no_backup=False
+        )
 
-        assert result.exit_code == 0
-        assert "Update command called for path:" in result.output
+        output = capsys.readouterr().out
+        assert f"Update command called for path: {target_dir}" in output
 
-    def test_update_dry_run(self):
+    def test_update_dry_run(self, runner, fresh_cwd):
         """Test update command with dry-run flag."""
-        result = self.runner.invoke(update, ["--dry-run"])
+        result = runner.invoke(update, ["--dry-run"])
 
         assert result.exit_code == 0
         assert "Dry run mode - no changes would be made" in result.output
@@ -163,45 +177,37 @@ class TestUpdateCommand:
 class TestCLIIntegration:
     """Test CLI integration and command composition."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    def test_main_deploy_integration(self):
+    def test_main_deploy_integration(self, runner, fresh_cwd, fake_github):
         """Test deploy command through main CLI entry point."""
-        with self.runner.isolated_filesystem():
-            result = self.runner.invoke(
-                main, ["deploy", "https://github.com/user/source.git"]
-            )
+        result = runner.invoke(main, ["deploy", "https://github.com/user/source.git"])
 
-            assert result.exit_code == 0
-            assert (
-                "Deploy command called with source: https://github.com/user/source.git"
-                in result.output
-            )
-            assert "Target path:" in result.output
+        assert result.exit_code == 0
+        _assert_contains(
+            result.output,
+            "Deploy command called with source: https://github.com/user/source.git",
+            "Target path:",
+        )
 
-    def test_main_update_integration(self):
+    def test_main_update_integration(self, runner, fresh_cwd):
         """Test update command through main CLI entry point."""
-        with self.runner.isolated_filesystem():
-            result = self.runner.invoke(main, ["update"])
+        result = runner.invoke(main, ["update"])
 
-            assert result.exit_code == 0
-            assert "Update command called for path:" in result.output
+        assert result.exit_code == 0
+        assert "Update command called for path:" in result.output
 
-    def test_invalid_command(self):
+    def test_invalid_command(self, runner):
         """Test invalid command shows help."""
-        result = self.runner.invoke(main, ["invalid-command"])
+        result = runner.invoke(main, ["invalid-command"])
 
         assert result.exit_code != 0
         assert "No such command" in result.output
 
-    def test_help_for_commands(self):
+    def test_help_for_commands(self, runner):
         """Test help works for all commands."""
         commands = ["deploy", "update"]
 
         for cmd in commands:
-            result = self.runner.invoke(main, [cmd, "--help"])
+            result = runner.invoke(main, [cmd, "--help"])
             assert result.exit_code == 0
             assert "Usage:" in result.output
 
@@ -209,224 +215,177 @@ class TestCLIIntegration:
 class TestConfigIntegration:
     """Test CLI integration with configuration file functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-
-    def test_deploy_creates_config_file(self):
+    def test_deploy_creates_config_file(self, runner, fresh_cwd):
         """Test that deploy command creates a configuration file."""
-        with self.runner.isolated_filesystem():
-            # Create a temporary directory for deployment target
-            target_path = Path("./test_target").resolve()
-            target_path.mkdir(exist_ok=True)
-
-            # This test will initially fail because deploy command doesn't save config yet
-            # We're mocking a successful deploy scenario by using dry-run to avoid GitHub API calls
-            result = self.runner.invoke(
-                deploy,
-                [
-                    "https://github.com/user/source.git",
-                    "--path",
-                    str(target_path),
-                    "--dry-run",
-                ],
-            )
-
-            # Verify the command ran
-            assert result.exit_code == 0
+        # Create a temporary directory for deployment target
+        target_path = fresh_cwd / "test_target"
+        target_path.mkdir(exist_ok=True)
+
+        # This test will initially fail because deploy command doesn't save config yet
+        # We're mocking a successful deploy scenario by using dry-run to avoid GitHub API calls
+        result = runner.invoke(
+            deploy,
+            [
+                "https://github.com/user/source.git",
+                "--path",
+                str(target_path),
+                "--dry-run",
+            ],
+        )
+
+        # Verify the command ran
+        assert result.exit_code == 0
 
-            # Check that config file was created
-            config_file = target_path / "specli.settings.json"
-            assert (
-                config_file.exists()
-            ), "Deploy command should create a configuration file"
-
-            # If config file exists, verify its contents
-            if config_file.exists():
-                import json
-
-                with open(config_file) as f:
-                    config_data = json.load(f)
-                assert (
-                    config_data["repository_url"]
-                    == "https://github.com/user/source.git"
-                )
-                assert "deployed_at" in config_data
-
-    def test_update_reads_config_file(self):
+        # Check that config file was created
+        config_file = target_path / "specli.settings.json"
+        assert config_file.exists(), "Deploy command should create a configuration file"
+
+        # If config file exists, verify its contents
+        if config_file.exists():
+            with open(config_file) as f:
+                config_data = json.load(f)
+            assert config_data["repository_url"] == "https://github.com/user/source.git"
+            assert "deployed_at" in config_data
+
+    def test_update_reads_config_file(self, runner, fresh_cwd):
         """Test that update command reads configuration file when no source is provided."""
-        with self.runner.isolated_filesystem():
-            # Create a temporary directory with a config file
-            target_path = Path("./test_target").resolve()
-            target_path.mkdir(exist_ok=True)
-
-            # Create a config file manually (simulating previous deploy)
-            import json
-
-            config_file = target_path / "specli.settings.json"
-            config_data = {
-                "repository_url": "https://github.com/user/saved-repo.git",
-                "branch": None,
-                "deployed_at": "2024-01-15T10:30:00Z",
-            }
-            with open(config_file, "w") as f:
-                json.dump(config_data, f, indent=2)
-
-            # Run update command without --source (should read from config)
-            result = self.runner.invoke(
-                update, ["--path", str(target_path), "--dry-run"]
-            )
-
-            # Verify the command ran
-            assert result.exit_code == 0
+        # Create a temporary directory with a config file
+        target_path = fresh_cwd / "test_target"
+        target_path.mkdir(exist_ok=True)
+
+        # Create a config file manually (simulating previous deploy)
+        config_file = target_path / "specli.settings.json"
+        config_data = {
+            "repository_url": "https://github.com/user/saved-repo.git",
+            "branch": None,
+            "deployed_at": "2024-01-15T10:30:00Z",
+        }
+        with open(config_file, "w") as f:
+            json.dump(config_data, f, indent=2)
+
+        # Run update command without --source (should read from config)
+        result = runner.invoke(update, ["--path", str(target_path), "--dry-run"])
+
+        # Verify the command ran
+        assert result.exit_code == 0
 
-            # This test will fail initially because update doesn't read config yet
-            # The update command should use the repository from config file, not prompt for input
-            assert (
-                "https://github.com/user/saved-repo.git" in result.output
-            ), "Update command should use repository from config file"
+        # This test will fail initially because update doesn't read config yet
+        # The update command should use the repository from config file, not prompt for input
+        assert (
+            "https://github.com/user/saved-repo.git" in result.output
+        ), "Update command should use repository from config file"
 
 
 class TestBackupIntegration:
     """Test backup functionality integrated with CLI commands."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        self.runner = CliRunner()
-
-    def test_update_command_accepts_no_backup_flag(self):
+    def test_update_command_accepts_no_backup_flag(self, runner, fresh_cwd):
         """Test that update command accepts --no-backup flag."""
-        with self.runner.isolated_filesystem():
-            # Create a config file to avoid prompting
-            import json
-            from pathlib import Path
-
-            from specli.main import update
-
-            target_path = Path(".").resolve()
-            config_file = target_path / "specli.settings.json"
-            config_data = {
-                "repository_url": "https://github.com/user/repo.git",
-                "branch": None,
-                "deployed_at": "2024-01-15T10:30:00Z",
-            }
-            with open(config_file, "w") as f:
-                json.dump(config_data, f, indent=2)
-
-            # Run update command with --no-backup flag
-            result = self.runner.invoke(update, ["--no-backup", "--dry-run"])
-
-            # Should run without prompting
-            assert result.exit_code == 0
-            assert "Create backup of .claude folder before update?" not in result.output
+        # Create a config file to avoid prompting
+        target_path = fresh_cwd
+        config_file = target_path / "specli.settings.json"
+        config_data = {
+            "repository_url": "https://github.com/user/repo.git",
+            "branch": None,
+            "deployed_at": "2024-01-15T10:30:00Z",
+        }
+        with open(config_file, "w") as f:
+            json.dump(config_data, f, indent=2)
+
+        # Run update command with --no-backup flag
+        result = runner.invoke(update, ["--no-backup", "--dry-run"])
+
+        # Should run without prompting
+        assert result.exit_code == 0
+        assert "Create backup of .claude folder before update?" not in result.output
 
-    def test_update_prompts_for_backup_by_default(self):
+    def test_update_prompts_for_backup_by_default(self, runner, fresh_cwd):
         """Test that update command prompts for backup when no flag is provided."""
-        with self.runner.isolated_filesystem():
-            # Create a config file to avoid source prompting
-            import json
-            from pathlib import Path
-
-            from specli.main import update
-
-            target_path = Path(".").resolve()
-            config_file = target_path / "specli.settings.json"
-            config_data = {
-                "repository_url": "https://github.com/user/repo.git",
-                "branch": None,
-                "deployed_at": "2024-01-15T10:30:00Z",
-            }
-            with open(config_file, "w") as f:
-                json.dump(config_data, f, indent=2)
-
-            # Create a .claude folder to backup
-            claude_folder = target_path / ".claude"
-            claude_folder.mkdir()
-            (claude_folder / "test.txt").write_text("content")
-
-            # Run update command without --no-backup flag
-            # Simulate user pressing Enter (default Yes)
-            result = self.runner.invoke(update, ["--dry-run"], input="\n")
-
-            # Should prompt for backup (if backup logic is integrated)
-            # This will fail initially until backup is integrated
-            assert "Create backup of .claude folder before update?" in result.output
-
-    def test_update_creates_backup_when_confirmed(self):
+        # Create a config file to avoid source prompting
+        target_path = fresh_cwd
+        config_file = target_path / "specli.settings.json"
+        config_data = {
+            "repository_url": "https://github.com/user/repo.git",
+            "branch": None,
+            "deployed_at": "2024-01-15T10:30:00Z",
+        }
+        with open(config_file, "w") as f:
+            json.dump(config_data, f, indent=2)
+
+        # Create a .claude folder to backup
+        claude_folder = target_path / ".claude"
+        claude_folder.mkdir()
+        (claude_folder / "test.txt").write_text("content")
+
+        # Run update command without --no-backup flag
+        # Simulate user pressing Enter (default Yes)
+        result = runner.invoke(update, ["--dry-run"], input="\n")
+
+        # Should prompt for backup (if backup logic is integrated)
+        # This will fail initially until backup is integrated
+        assert "Create backup of .claude folder before update?" in result.output
+
+    def test_update_creates_backup_when_confirmed(self, runner, fresh_cwd):
         """Test that update creates backup when user confirms."""
-        with self.runner.isolated_filesystem():
-            import json
-            from pathlib import Path
-
-            from specli.main import update
-
-            target_path = Path(".").resolve()
-
-            # Create a config file
-            config_file = target_path / "specli.settings.json"
-            config_data = {
-                "repository_url": "https://github.com/user/repo.git",
-                "branch": None,
-                "deployed_at": "2024-01-15T10:30:00Z",
-            }
-            with open(config_file, "w") as f:
-                json.dump(config_data, f, indent=2)
-
-            # Create a .claude folder with content
-            claude_folder = target_path / ".claude"
-            claude_folder.mkdir()
-            (claude_folder / "test.txt").write_text("original content")
-
-            # Run update command and confirm backup
-            _ = self.runner.invoke(update, ["--dry-run"], input="y\n")
-
-            # Check that backup folder was created
-            backup_root = target_path / ".claude-backup"
-            if backup_root.exists():
-                # Should have at least one backup folder
-                backup_folders = list(backup_root.iterdir())
-                assert len(backup_folders) > 0
-                # Check that backup contains the original content
-                backup_folder = backup_folders[0]
-                assert (backup_folder / ".claude" / "test.txt").exists()
-
-    def test_update_skips_backup_with_no_backup_flag(self):
+        target_path = fresh_cwd
+
+        # Create a config file
+        config_file = target_path / "specli.settings.json"
+        config_data = {
+            "repository_url": "https://github.com/user/repo.git",
+            "branch": None,
+            "deployed_at": "2024-01-15T10:30:00Z",
+        }
+        with open(config_file, "w") as f:
+            json.dump(config_data, f, indent=2)
+
+        # Create a .claude folder with content
+        claude_folder = target_path / ".claude"
+        claude_folder.mkdir()
+        (claude_folder / "test.txt").write_text("original content")
+
+        # Run update command and confirm backup
+        _ = runner.invoke(update, ["--dry-run"], input="y\n")
+
+        # Check that backup folder was created
+        backup_root = target_path / ".claude-backup"
+        if backup_root.exists():
+            # Should have at least one backup folder
+            backup_folders = list(backup_root.iterdir())
+            assert len(backup_folders) > 0
+            # Check that backup contains the original content
+            backup_folder = backup_folders[0]
+            assert (backup_folder / ".claude" / "test.txt").exists()
+
+    def test_update_skips_backup_with_no_backup_flag(self, runner, fresh_cwd):
         """Test that update skips backup creation when --no-backup is used."""
-        with self.runner.isolated_filesystem():
-            import json
-            from pathlib import Path
-
-            from specli.main import update
-
-            target_path = Path(".").resolve()
-
-            # Create a config file
-            config_file = target_path / "specli.settings.json"
-            config_data = {
-                "repository_url": "https://github.com/user/repo.git",
-                "branch": None,
-                "deployed_at": "2024-01-15T10:30:00Z",
-            }
-            with open(config_file, "w") as f:
-                json.dump(config_data, f, indent=2)
-
-            # Create a .claude folder
-            claude_folder = target_path / ".claude"
-            claude_folder.mkdir()
-            (claude_folder / "test.txt").write_text("content")
-
-            # Run update command with --no-backup
-            _ = self.runner.invoke(update, ["--no-backup", "--dry-run"])
-
-            # Should not create backup folder
-            backup_root = target_path / ".claude-backup"
-            assert not backup_root.exists()
-
-    def test_update_help_shows_no_backup_flag(self):
+        target_path = fresh_cwd
+
+        # Create a config file
+        config_file = target_path / "specli.settings.json"
+        config_data = {
+            "repository_url": "https://github.com/user/repo.git",
+            "branch": None,
+            "deployed_at": "2024-01-15T10:30:00Z",
+        }
+        with open(config_file, "w") as f:
+            json.dump(config_data, f, indent=2)
+
+        # Create a .claude folder
+        claude_folder = target_path / ".claude"
+        claude_folder.mkdir()
+        (claude_folder / "test.txt").write_text("content")
+
+        # Run update command with --no-backup
+        _ = runner.invoke(update, ["--no-backup", "--dry-run"])
+
+        # Should not create backup folder
+        backup_root = target_path / ".claude-backup"
+        assert not backup_root.exists()
+
+    def test_update_help_shows_no_backup_flag(self, runner):
         """Test that update help text includes --no-backup flag documentation."""
-        from specli.main import update
-
-        result = self.runner.invoke(update, ["--help"])
+        result = runner.invoke(update, ["--help"])
 
         assert result.exit_code == 0
         assert "--no-backup" in result.output
@@ -9,133 +9,117 @@ Covers:
 """
 
 import json
-import tempfile
+import os
+from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
-from specli.config import load_config, save_config
+from specli.config import _write_all, load_config, save_config
 
+# Keys and value types load_config returns for a saved configuration
+_LOADED_CONFIG_SHAPE = MappingProxyType(
+    {
+        "repository_url": str,
+        "branch": str,
+        "deployed_at": str,
+        "config_exists": bool,
+        "config_file": Path,
+    }
+)
 
-class TestConfigurationModuleStructure:
-    """Test basic configuration module interface exists."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_path = Path(self.temp_dir)
+def _read_cfg(config_file):
+    """Parse a saved configuration file."""
+    return json.loads(config_file.read_bytes())
 
-    def test_save_config_function_exists(self):
-        """Test that save_config function exists and can be called."""
-        # This should not raise an AttributeError
-        assert callable(save_config)
 
-    def test_load_config_function_exists(self):
-        """Test that load_config function exists and can be called."""
-        # This should not raise an AttributeError
-        assert callable(load_config)
+def _rewrite_in_place(config_file, payload):
+    """Overwrite a file's bytes in place, keeping its inode and mtime."""
+    stat_result = config_file.stat()
+    with open(config_file, "r+b") as f:
+        f.write(payload)
+        f.truncate()
+    os.utime(config_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
 
-    def test_save_config_accepts_parameters(self):
-        """Test that save_config accepts repository URL and target path."""
-        # This should not raise a TypeError
-        result = save_config("https://github.com/user/repo", self.config_path)
-        assert result is not None
 
-    def test_load_config_accepts_parameters(self):
-        """Test that load_config accepts target path."""
-        # This should not raise a TypeError
-        result = load_config(self.config_path)
-        assert result is not None
+def _assert_has_shape(result, schema):
+    """Assert result has every schema key with a value of the mapped type."""
+    missing = schema.keys() - result.keys()
+    assert not missing, f"missing keys: {sorted(missing)}"
+    wrong = [
+        (key, type(result[key]))
+        for key, expected in schema.items()
+        if not isinstance(result[key], expected)
+    ]
+    assert not wrong, wrong
 
-    def test_save_config_returns_success_status(self):
-        """Test that save_config returns a dictionary with success status."""
-        result = save_config("https://github.com/user/repo", self.config_path)
-        assert isinstance(result, dict)
-        assert "success" in result
 
-    def test_load_config_returns_configuration_data(self):
-        """Test that load_config returns configuration data."""
-        result = load_config(self.config_path)
-        assert isinstance(result, dict)
+@pytest.fixture
+def cfg_dir(tmp_path_factory):
+    """Fresh, empty directory to save and load configuration in."""
+    return tmp_path_factory.mktemp("cfg", numbered=True)
 
 
-class TestConfigurationBasicBehavior:
-    """Test basic configuration behavior without actual file operations."""
+@pytest.fixture(scope="module")
+def saved_cfg_dir(tmp_path_factory):
+    """Directory holding one saved configuration, shared by read-only tests."""
+    directory = tmp_path_factory.mktemp("saved_cfg")
+    save_config("https://github.com/user/test-repo", directory, branch="main")
+    return directory
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_path = Path(self.temp_dir)
 
-    def test_save_config_with_minimal_parameters(self):
-        """Test save_config with just repository URL and path."""
-        result = save_config("https://github.com/user/repo", self.config_path)
-        assert result["success"] is True or result["success"] is False
+class _FakeClock:
+    """Stand-in for datetime whose now() only moves when advanced."""
 
-    def test_save_config_with_optional_branch(self):
-        """Test save_config with optional branch parameter."""
-        result = save_config(
-            "https://github.com/user/repo", self.config_path, branch="main"
-        )
-        assert result["success"] is True or result["success"] is False
+    def __init__(self):
+        self.current = datetime(2024, 1, 1)
 
-    def test_load_config_from_empty_directory(self):
-        """Test load_config when no configuration exists."""
-        result = load_config(self.config_path)
-        # Should return some kind of result, even if config doesn't exist
-        assert isinstance(result, dict)
+    def now(self):
+        return self.current
 
-    def test_config_functions_handle_pathlib_paths(self):
-        """Test that config functions work with pathlib.Path objects."""
-        path_obj = Path(self.temp_dir)
+    def advance(self, seconds=1):
+        self.current += timedelta(seconds=seconds)
 
-        save_result = save_config("https://github.com/user/repo", path_obj)
-        assert isinstance(save_result, dict)
 
-        load_result = load_config(path_obj)
-        assert isinstance(load_result, dict)
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the clock save_config stamps deployed_at with."""
+    clock = _FakeClock()
+    monkeypatch.setattr("specli.config.datetime", clock)
+    return clock
 
 
 class TestConfigurationFileSaving:
     """Test actual configuration file creation and saving."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_path = Path(self.temp_dir)
-        self.config_file = self.config_path / "specli.settings.json"
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_save_config_creates_json_file(self):
+    def test_save_config_creates_json_file(self, cfg_dir):
         """Test that save_config actually creates a JSON file."""
+        config_file = cfg_dir / "specli.settings.json"
         repository_url = "https://github.com/user/test-repo"
 
-        result = save_config(repository_url, self.config_path)
+        result = save_config(repository_url, cfg_dir)
 
         # Verify the operation was successful
         assert result["success"] is True
 
         # Verify the file was actually created
-        assert self.config_file.exists()
-        assert self.config_file.is_file()
+        assert config_file.exists()
+        assert config_file.is_file()
 
-    def test_save_config_creates_valid_json_content(self):
+    def test_save_config_creates_valid_json_content(self, cfg_dir):
         """Test that save_config creates valid JSON with correct structure."""
+        config_file = cfg_dir / "specli.settings.json"
         repository_url = "https://github.com/user/test-repo"
         branch = "main"
 
-        save_config(repository_url, self.config_path, branch=branch)
+        save_config(repository_url, cfg_dir, branch=branch)
 
         # Verify file exists and contains valid JSON
-        assert self.config_file.exists()
+        assert config_file.exists()
 
-        with open(self.config_file) as f:
-            config_data = json.load(f)
+        config_data = _read_cfg(config_file)
 
         # Verify required fields are present
         assert config_data["repository_url"] == repository_url
@@ -143,49 +127,46 @@ class TestConfigurationFileSaving:
         assert "deployed_at" in config_data
 
         # Verify timestamp format (should be ISO format)
-        from datetime import datetime
-
         datetime.fromisoformat(config_data["deployed_at"].replace("Z", "+00:00"))
 
-    def test_save_config_without_branch(self):
+    def test_save_config_without_branch(self, cfg_dir):
         """Test save_config works without optional branch parameter."""
+        config_file = cfg_dir / "specli.settings.json"
         repository_url = "https://github.com/user/test-repo"
 
-        save_config(repository_url, self.config_path)
+        save_config(repository_url, cfg_dir)
 
-        assert self.config_file.exists()
+        assert config_file.exists()
 
-        with open(self.config_file) as f:
-            config_data = json.load(f)
+        config_data = _read_cfg(config_file)
 
         assert config_data["repository_url"] == repository_url
         assert config_data["branch"] is None
         assert "deployed_at" in config_data
 
-    def test_save_config_overwrites_existing_file(self):
+    def test_save_config_overwrites_existing_file(self, cfg_dir):
         """Test that save_config overwrites existing configuration file."""
+        config_file = cfg_dir / "specli.settings.json"
         # Create initial config
         repository_url_1 = "https://github.com/user/repo1"
-        save_config(repository_url_1, self.config_path)
+        save_config(repository_url_1, cfg_dir)
 
         # Verify initial content
-        with open(self.config_file) as f:
-            initial_data = json.load(f)
+        initial_data = _read_cfg(config_file)
         assert initial_data["repository_url"] == repository_url_1
 
         # Overwrite with new config
         repository_url_2 = "https://github.com/user/repo2"
-        save_config(repository_url_2, self.config_path, branch="develop")
+        save_config(repository_url_2, cfg_dir, branch="develop")
 
         # Verify new content overwrote the old
-        with open(self.config_file) as f:
-            new_data = json.load(f)
+        new_data = _read_cfg(config_file)
         assert new_data["repository_url"] == repository_url_2
         assert new_data["branch"] == "develop"
 
-    def test_save_config_creates_nonexistent_directory(self):
+    def test_save_config_creates_nonexistent_directory(self, cfg_dir):
         """Test save_config creates nonexistent directories automatically."""
-        nonexistent_path = self.config_path / "nonexistent" / "directory"
+        nonexistent_path = cfg_dir / "nonexistent" / "directory"
         repository_url = "https://github.com/user/test-repo"
 
         result = save_config(repository_url, nonexistent_path)
@@ -195,224 +176,320 @@ class TestConfigurationFileSaving:
         assert nonexistent_path.exists()
         assert (nonexistent_path / "specli.settings.json").exists()
 
-    def test_save_config_handles_permission_denied(self):
+    @pytest.mark.permission
+    def test_save_config_handles_permission_denied(self, cfg_dir):
         """Test save_config behavior when file creation is denied."""
         # This test is platform-specific and may not work on all systems
-        import os
-
         if os.name == "nt":  # Windows
             # Skip this test on Windows due to permission model differences
             pytest.skip("Permission test not applicable on Windows")
 
         # Make directory read-only
-        os.chmod(self.config_path, 0o444)
+        os.chmod(cfg_dir, 0o444)
 
         try:
             repository_url = "https://github.com/user/test-repo"
-            result = save_config(repository_url, self.config_path)
+            result = save_config(repository_url, cfg_dir)
 
             # Should handle the error gracefully
             assert result["success"] is False
             assert "error" in result
         finally:
             # Restore permissions for cleanup
-            os.chmod(self.config_path, 0o755)
+            os.chmod(cfg_dir, 0o755)
 
+    def test_save_config_leaves_no_temp_file(self, cfg_dir):
+        """Test save_config removes its temporary sibling once the write lands."""
+        save_config("https://github.com/user/test-repo", cfg_dir)
 
-class TestConfigurationFileReading:
-    """Test actual configuration file reading and loading."""
+        assert [path.name for path in cfg_dir.iterdir()] == ["specli.settings.json"]
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_path = Path(self.temp_dir)
-        self.config_file = self.config_path / "specli.settings.json"
+    def test_write_all_completes_short_writes(self):
+        """Test the config write loop keeps going after a partial write."""
+        written = bytearray()
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
+        def short_write(fd, data):
+            written.extend(data[:5])
+            return len(data[:5])
 
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _write_all(3, b"0123456789abcdef", write=short_write)
 
-    def test_load_config_reads_existing_file(self):
-        """Test that load_config reads an existing configuration file."""
-        # Create a config file first
-        repository_url = "https://github.com/user/test-repo"
-        branch = "main"
-        save_config(repository_url, self.config_path, branch=branch)
+        assert written == b"0123456789abcdef"
+
+    def test_save_config_failed_write_keeps_original(self, cfg_dir, monkeypatch):
+        """Test a failed write leaves the previous config and no temp file."""
+        config_file = cfg_dir / "specli.settings.json"
+        save_config("https://github.com/user/original", cfg_dir)
+        original = config_file.read_bytes()
+
+        def failing_write(fd, payload):
+            raise OSError(28, "No space left on device")
 
-        # Now load it
-        result = load_config(self.config_path)
+        monkeypatch.setattr("specli.config._write_all", failing_write)
+        result = save_config("https://github.com/user/replacement", cfg_dir)
+
+        assert result["success"] is False
+        assert "No space left on device" in result["error"]
+        assert config_file.read_bytes() == original
+        assert [path.name for path in cfg_dir.iterdir()] == ["specli.settings.json"]
+
+    def test_save_config_reports_unwritable_target(self, cfg_dir):
+        """Test save_config fails cleanly when the config path is a directory."""
+        (cfg_dir / "specli.settings.json").mkdir()
+
+        result = save_config("https://github.com/user/test-repo", cfg_dir)
+
+        assert result["success"] is False
+        assert "error" in result
+        assert not (cfg_dir / "specli.settings.json.tmp").exists()
+
+
+class TestConfigurationFileReading:
+    """Test actual configuration file reading and loading."""
+
+    def test_load_config_reads_existing_file(self, saved_cfg_dir):
+        """Test that load_config reads an existing configuration file."""
+        result = load_config(saved_cfg_dir)
 
         # Verify the loaded data
         assert result["config_exists"] is True
-        assert result["repository_url"] == repository_url
-        assert result["branch"] == branch
+        assert result["repository_url"] == "https://github.com/user/test-repo"
+        assert result["branch"] == "main"
         assert "deployed_at" in result
 
-    def test_load_config_handles_missing_file(self):
+    def test_load_config_handles_missing_file(self, cfg_dir):
         """Test load_config behavior when no configuration file exists."""
-        result = load_config(self.config_path)
+        config_file = cfg_dir / "specli.settings.json"
+        result = load_config(cfg_dir)
 
         # Should indicate no config exists
         assert result["config_exists"] is False
         assert result["repository_url"] is None
         assert result["branch"] is None
-        assert result["config_file"] == self.config_file
+        assert result["config_file"] == config_file
 
-    def test_load_config_reads_file_without_branch(self):
+    def test_load_config_reads_file_without_branch(self, cfg_dir):
         """Test load_config reads configuration saved without branch."""
         repository_url = "https://github.com/user/test-repo"
-        save_config(repository_url, self.config_path)  # No branch specified
+        save_config(repository_url, cfg_dir)  # No branch specified
 
-        result = load_config(self.config_path)
+        result = load_config(cfg_dir)
 
         assert result["config_exists"] is True
         assert result["repository_url"] == repository_url
         assert result["branch"] is None
 
-    def test_load_config_validates_json_structure(self):
+    def test_load_config_validates_json_structure(self, saved_cfg_dir):
         """Test load_config validates the JSON structure is correct."""
-        repository_url = "https://github.com/user/test-repo"
-        save_config(repository_url, self.config_path, branch="develop")
-
-        result = load_config(self.config_path)
+        result = load_config(saved_cfg_dir)
 
-        # Check all expected fields are present
-        assert "repository_url" in result
-        assert "branch" in result
-        assert "deployed_at" in result
-        assert "config_exists" in result
-        assert "config_file" in result
+        # Check all expected fields are present with the right types
+        _assert_has_shape(result, _LOADED_CONFIG_SHAPE)
 
         # Verify field values
-        assert result["repository_url"] == repository_url
-        assert result["branch"] == "develop"
+        assert result["repository_url"] == "https://github.com/user/test-repo"
+        assert result["branch"] == "main"
 
-    def test_load_config_handles_corrupted_json(self):
+    def test_load_config_handles_corrupted_json(self, cfg_dir):
         """Test load_config behavior with corrupted JSON file."""
+        config_file = cfg_dir / "specli.settings.json"
         # Create a corrupted JSON file
-        with open(self.config_file, "w") as f:
+        with open(config_file, "w") as f:
             f.write("{ invalid json content")
 
-        result = load_config(self.config_path)
+        result = load_config(cfg_dir)
 
         # Should handle the error gracefully
         assert result["config_exists"] is False
         assert "error" in result
 
-    def test_load_config_handles_invalid_json_structure(self):
+    def test_load_config_handles_invalid_json_structure(self, cfg_dir):
         """Test load_config behavior with valid JSON but wrong structure."""
+        config_file = cfg_dir / "specli.settings.json"
         # Create JSON with wrong structure
         invalid_config = {"wrong_field": "wrong_value"}
-        with open(self.config_file, "w") as f:
+        with open(config_file, "w") as f:
             json.dump(invalid_config, f)
 
-        result = load_config(self.config_path)
+        result = load_config(cfg_dir)
 
         # Should handle the invalid structure
         assert result["config_exists"] is False
         assert "error" in result
 
-    def test_load_config_preserves_file_path_info(self):
+    @pytest.mark.parametrize("payload", ["42", '"repository_url deployed_at"', "[]"])
+    def test_load_config_rejects_non_object_json(self, cfg_dir, payload):
+        """Test load_config reports an error when the JSON is not an object."""
+        config_file = cfg_dir / "specli.settings.json"
+        config_file.write_text(payload)
+
+        result = load_config(cfg_dir)
+
+        assert result["config_exists"] is False
+        assert result["error"] == "Configuration file must contain a JSON object"
+
+    def test_load_config_preserves_file_path_info(self, cfg_dir):
         """Test that load_config returns file path information."""
-        result = load_config(self.config_path)
+        config_file = cfg_dir / "specli.settings.json"
+        result = load_config(cfg_dir)
 
-        assert result["config_file"] == self.config_file
-        assert str(self.config_path) in str(result["config_file"])
+        assert result["config_file"] == config_file
+        assert str(cfg_dir) in str(result["config_file"])
 
-    def test_load_config_multiple_reads_consistent(self):
+    def test_load_config_multiple_reads_consistent(self, saved_cfg_dir):
         """Test that multiple reads of the same config return consistent data."""
-        repository_url = "https://github.com/user/test-repo"
-        save_config(repository_url, self.config_path, branch="main")
-
-        result1 = load_config(self.config_path)
-        result2 = load_config(self.config_path)
+        result1 = load_config(saved_cfg_dir)
+        result2 = load_config(saved_cfg_dir)
 
         # Results should be identical
         assert result1["repository_url"] == result2["repository_url"]
         assert result1["branch"] == result2["branch"]
         assert result1["deployed_at"] == result2["deployed_at"]
 
+    def test_load_config_returns_independent_copies(self, saved_cfg_dir):
+        """Test that mutating a loaded config does not leak into later loads."""
+        result1 = load_config(saved_cfg_dir)
+        result1["repository_url"] = "https://github.com/user/mutated"
+        result2 = load_config(saved_cfg_dir)
+
+        assert result2["repository_url"] == "https://github.com/user/test-repo"
+
+    def test_load_config_sees_external_edits(self, cfg_dir):
+        """Test that load_config picks up a config file rewritten on disk."""
+        config_file = cfg_dir / "specli.settings.json"
+        save_config("https://github.com/user/test-repo", cfg_dir)
+        load_config(cfg_dir)
+
+        edited_config = {
+            "repository_url": "https://github.com/user/edited-repository",
+            "branch": "main",
+            "deployed_at": "2024-01-15T10:30:00Z",
+        }
+        with open(config_file, "w") as f:
+            json.dump(edited_config, f)
+
+        result = load_config(cfg_dir)
+
+        assert result["repository_url"] == edited_config["repository_url"]
+        assert result["branch"] == "main"
+
+    def test_load_config_sees_save_config_rewrite(self, cfg_dir):
+        """Test a config rewritten by save_config is not served from cache."""
+        save_config("https://github.com/user/first-repo", cfg_dir)
+        load_config(cfg_dir)
+
+        save_config("https://github.com/user/other-repo", cfg_dir, branch="v2")
+        result = load_config(cfg_dir)
+
+        assert result["repository_url"] == "https://github.com/user/other-repo"
+        assert result["branch"] == "v2"
+
+    def test_load_config_sees_replaced_file_with_same_size_and_mtime(self, cfg_dir):
+        """Test an atomic replace is detected by its new inode alone."""
+        config_file = cfg_dir / "specli.settings.json"
+        save_config("https://github.com/user/first-repo", cfg_dir)
+        load_config(cfg_dir)
+        old_stat = config_file.stat()
+
+        replacement = cfg_dir / "replacement.json"
+        replacement.write_bytes(
+            config_file.read_bytes().replace(b"first-repo", b"other-repo")
+        )
+        os.utime(replacement, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+        os.replace(replacement, config_file)
 
-class TestConfigurationOverride:
-    """Test repository override functionality."""
+        result = load_config(cfg_dir)
+
+        assert result["repository_url"] == "https://github.com/user/other-repo"
+
+    @pytest.mark.parametrize(
+        "invalid_payload",
+        [b'["repository_url", "deployed_at"]', b'{"repository_url": "u"}'],
+        ids=["non-object", "missing-field"],
+    )
+    def test_load_config_does_not_cache_invalid_files(self, cfg_dir, invalid_payload):
+        """Test a rejected file is re-read once it becomes valid."""
+        config_file = cfg_dir / "specli.settings.json"
+        valid_payload = b'{"repository_url": "u", "deployed_at": "d"}'
+        config_file.write_bytes(invalid_payload.ljust(len(valid_payload)))
+
+        assert load_config(cfg_dir)["config_exists"] is False
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_path = Path(self.temp_dir)
-        self.config_file = self.config_path / "specli.settings.json"
+        # Same inode, size and mtime: only a cached rejection could hide this
+        _rewrite_in_place(config_file, valid_payload)
+        result = load_config(cfg_dir)
+
+        assert result["config_exists"] is True
+        assert result["repository_url"] == "u"
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
 
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+class TestConfigurationOverride:
+    """Test repository override functionality."""
 
-    def test_override_existing_repository_url(self):
+    def test_override_existing_repository_url(self, cfg_dir, fake_clock):
         """Test that new repository URL overwrites existing one."""
         # Save initial configuration
         original_repo = "https://github.com/user/original-repo"
-        save_config(original_repo, self.config_path, branch="main")
+        save_config(original_repo, cfg_dir, branch="main")
 
         # Load to verify initial state
-        initial_config = load_config(self.config_path)
+        initial_config = load_config(cfg_dir)
         assert initial_config["repository_url"] == original_repo
         assert initial_config["branch"] == "main"
 
-        # Override with new repository (add small delay to ensure different timestamp)
-        import time
-
-        time.sleep(1)
+        # Override with new repository at a later time
+        fake_clock.advance()
         new_repo = "https://github.com/user/new-repo"
-        save_config(new_repo, self.config_path, branch="develop")
+        save_config(new_repo, cfg_dir, branch="develop")
 
         # Load and verify override worked
-        updated_config = load_config(self.config_path)
+        updated_config = load_config(cfg_dir)
         assert updated_config["repository_url"] == new_repo
         assert updated_config["branch"] == "develop"
         # Timestamp should be updated
         assert updated_config["deployed_at"] != initial_config["deployed_at"]
 
-    def test_override_preserves_file_location(self):
+    def test_override_preserves_file_location(self, cfg_dir):
         """Test that override operations preserve the config file location."""
+        config_file = cfg_dir / "specli.settings.json"
         original_repo = "https://github.com/user/original-repo"
-        save_config(original_repo, self.config_path)
+        save_config(original_repo, cfg_dir)
 
         new_repo = "https://github.com/user/new-repo"
-        result = save_config(new_repo, self.config_path)
+        result = save_config(new_repo, cfg_dir)
 
         # File should still be in the same location
-        assert result["config_file"] == self.config_file
-        assert self.config_file.exists()
-
-    def test_override_from_branch_to_no_branch(self):
-        """Test overriding configuration from having a branch to no branch."""
-        # Initial config with branch
-        save_config("https://github.com/user/repo", self.config_path, branch="feature")
-        initial_config = load_config(self.config_path)
-        assert initial_config["branch"] == "feature"
-
-        # Override without branch
-        save_config("https://github.com/user/repo", self.config_path)
-        updated_config = load_config(self.config_path)
-        assert updated_config["branch"] is None
-
-    def test_override_from_no_branch_to_branch(self):
-        """Test overriding configuration from no branch to having a branch."""
-        # Initial config without branch
-        save_config("https://github.com/user/repo", self.config_path)
-        initial_config = load_config(self.config_path)
-        assert initial_config["branch"] is None
-
-        # Override with branch
-        save_config("https://github.com/user/repo", self.config_path, branch="main")
-        updated_config = load_config(self.config_path)
-        assert updated_config["branch"] == "main"
-
-    def test_multiple_overrides(self):
+        assert result["config_file"] == config_file
+        assert config_file.exists()
+
+    @pytest.mark.parametrize(
+        "initial_branch,new_branch",
+        [("feature", None), (None, "main"), ("main", "develop")],
+    )
+    def test_override_branch_transitions(
+        self, cfg_dir, fake_clock, initial_branch, new_branch
+    ):
+        """Test overriding with the same repository but a different branch."""
+        repo_url = "https://github.com/user/test-repo"
+
+        # Initial save
+        save_config(repo_url, cfg_dir, branch=initial_branch)
+        initial_config = load_config(cfg_dir)
+        assert initial_config["branch"] == initial_branch
+
+        # Override with same repo, different branch at a later time
+        fake_clock.advance()
+        save_config(repo_url, cfg_dir, branch=new_branch)
+        updated_config = load_config(cfg_dir)
+
+        # Repository should be same, branch should be updated
+        assert updated_config["repository_url"] == repo_url
+        assert updated_config["branch"] == new_branch
+        assert updated_config["deployed_at"] != initial_config["deployed_at"]
+
+    def test_multiple_overrides(self, cfg_dir):
         """Test multiple consecutive overrides work correctly."""
+        config_file = cfg_dir / "specli.settings.json"
         repos = [
             "https://github.com/user/repo1",
             "https://github.com/user/repo2",
@@ -422,34 +499,51 @@ class TestConfigurationOverride:
         # Apply multiple overrides
         for i, repo in enumerate(repos):
             branch = f"branch-{i}" if i % 2 == 0 else None
-            save_config(repo, self.config_path, branch=branch)
+            save_config(repo, cfg_dir, branch=branch)
 
-            # Verify each override worked
-            config = load_config(self.config_path)
-            assert config["repository_url"] == repo
-            assert config["branch"] == branch
+            # Verify each override reached the file
+            config_data = _read_cfg(config_file)
+            assert config_data["repository_url"] == repo
+            assert config_data["branch"] == branch
 
         # Final verification
-        final_config = load_config(self.config_path)
+        final_config = load_config(cfg_dir)
         assert final_config["repository_url"] == repos[-1]
         assert final_config["branch"] == "branch-2"  # Last branch was branch-2
 
-    def test_override_handles_same_repository_different_branch(self):
-        """Test overriding with same repository but different branch."""
-        repo_url = "https://github.com/user/test-repo"
 
-        # Initial save
-        save_config(repo_url, self.config_path, branch="main")
-        initial_config = load_config(self.config_path)
+class TestConfigurationSerialization:
+    """Test that the optional orjson backend matches the stdlib json one."""
 
-        # Override with same repo, different branch (add small delay)
-        import time
+    @pytest.fixture
+    def real_orjson(self):
+        """The installed orjson module; skips when the extra is absent."""
+        return pytest.importorskip("orjson")
 
-        time.sleep(1)
-        save_config(repo_url, self.config_path, branch="develop")
-        updated_config = load_config(self.config_path)
+    def test_orjson_and_json_write_identical_files(
+        self, cfg_dir, fake_clock, monkeypatch, real_orjson
+    ):
+        """Test save_config writes the same bytes with or without orjson."""
+        repository_url = "https://github.com/user/café-commands"
 
-        # Repository should be same, branch should be updated
-        assert updated_config["repository_url"] == repo_url
-        assert updated_config["branch"] == "develop"
-        assert updated_config["deployed_at"] != initial_config["deployed_at"]
+        monkeypatch.setattr("specli.config.orjson", real_orjson)
+        save_config(repository_url, cfg_dir / "orjson", branch="main")
+        monkeypatch.setattr("specli.config.orjson", None)
+        save_config(repository_url, cfg_dir / "json", branch="main")
+
+        orjson_bytes = (cfg_dir / "orjson" / "specli.settings.json").read_bytes()
+        json_bytes = (cfg_dir / "json" / "specli.settings.json").read_bytes()
+        assert orjson_bytes == json_bytes
+
+    def test_json_loads_config_saved_with_orjson(
+        self, cfg_dir, monkeypatch, real_orjson
+    ):
+        """Test a config written through orjson loads through stdlib json."""
+        monkeypatch.setattr("specli.config.orjson", real_orjson)
+        save_config("https://github.com/user/test-repo", cfg_dir, branch="main")
+        monkeypatch.setattr("specli.config.orjson", None)
+
+        result = load_config(cfg_dir)
+
+        assert result["repository_url"] == "https://github.com/user/test-repo"
+        assert result["branch"] == "main"
@@ -7,6 +7,7 @@ Covers:
 """
 
 import subprocess
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 import pytest
@@ -14,6 +15,94 @@ import pytest
 # Import the modules that will be implemented
 # For now, we'll create the expected interface
 
+# Canned gh CLI responses, built once at import and shared, since no test
+# mutates them.
+_GH_VERSION_OK = Mock(
+    returncode=0, stdout="gh version 2.40.1 (2023-12-13)\n", stderr=""
+)
+_GH_VERSION_OLD = Mock(returncode=0, stdout="gh version 1.0.0\n", stderr="")
+_GH_AUTH_OK = Mock(
+    returncode=0,
+    stdout="github.com\n  ✓ Logged in to github.com as testuser (oauth_token)\n",
+    stderr="",
+)
+_GH_AUTH_MISSING = Mock(
+    returncode=1,
+    stdout="",
+    stderr="You are not logged into any GitHub hosts. Run gh auth login to authenticate.\n",
+)
+_GH_API_USER_OK = Mock(
+    returncode=0, stdout='{"login": "testuser", "id": 12345}\n', stderr=""
+)
+_GH_BAD_CREDENTIALS = Mock(
+    returncode=1,
+    stdout="",
+    stderr="HTTP 401: Bad credentials (https://api.github.com/user)\n",
+)
+_GH_REPO_OK = Mock(
+    returncode=0,
+    stdout='{"name": "test-repo", "owner": {"login": "testuser"}, "clone_url": "https://github.com/testuser/test-repo.git"}\n',
+    stderr="",
+)
+_GH_REPO_NOT_FOUND = Mock(
+    returncode=1,
+    stdout="",
+    stderr="HTTP 404: Not Found (https://api.github.com/repos/testuser/nonexistent)\n",
+)
+_GH_REPO_FORBIDDEN = Mock(
+    returncode=1,
+    stdout="",
+    stderr="HTTP 403: Forbidden (https://api.github.com/repos/private/repo)\n",
+)
+_GH_REPO_NAME_OK = Mock(returncode=0, stdout='{"name": "repo"}\n', stderr="")
+_GH_CLONE_OK = Mock(returncode=0, stdout="Cloning into 'test-repo'...\n", stderr="")
+_GH_CLONE_NOT_FOUND = Mock(
+    returncode=1, stdout="", stderr="ERROR: Repository not found\n"
+)
+_GH_PERMISSIONS_OK = Mock(
+    returncode=0,
+    stdout='{"permissions": {"admin": false, "push": true, "pull": true}}\n',
+    stderr="",
+)
+_GH_CONTENTS_OK = Mock(
+    returncode=0,
+    stdout='[{"name": ".claude", "type": "dir"}, {"name": "README.md", "type": "file"}]\n',
+    stderr="",
+)
+_GH_RATE_LIMITED = Mock(
+    returncode=1, stdout="", stderr="HTTP 403: API rate limit exceeded\n"
+)
+_GH_UNAVAILABLE = Mock(
+    returncode=1, stdout="", stderr="HTTP 503: Service Unavailable\n"
+)
+_GH_INVALID_URL = Mock(
+    returncode=1, stdout="", stderr="ERROR: invalid repository URL\n"
+)
+_GH_UNKNOWN_COMMAND = Mock(returncode=1, stderr="Unknown command")
+
+# Mock API responses for different endpoints, read-only for every test
+_API_RESPONSES = MappingProxyType(
+    {
+        "/user": {"login": "testuser", "id": 12345},
+        "/repos/testuser/test-repo": {
+            "name": "test-repo",
+            "owner": {"login": "testuser"},
+            "permissions": {"admin": False, "push": True, "pull": True},
+        },
+        "/repos/testuser/test-repo/contents": [
+            {"name": ".claude", "type": "dir"},
+            {"name": "README.md", "type": "file"},
+        ],
+    }
+)
+
+# Responses for whole gh command lines, looked up by the exact argument tuple
+_GH_RESPONSE_TABLE = {
+    ("gh", "--version"): _GH_VERSION_OK,
+    ("gh", "auth", "status"): _GH_AUTH_OK,
+    ("gh", "api", "user"): _GH_API_USER_OK,
+}
+
 
 class TestGitHubCLIDetection:
     """Test detection and validation of GitHub CLI installation."""
@@ -22,9 +111,7 @@ class TestGitHubCLIDetection:
     def test_github_cli_installed(self, mock_run):
         """Test detection when GitHub CLI is installed."""
         # Mock successful gh --version command
-        mock_run.return_value = Mock(
-            returncode=0, stdout="gh version 2.40.1 (2023-12-13)\n", stderr=""
-        )
+        mock_run.return_value = _GH_VERSION_OK
 
         # This would be implemented in the github module
         result = subprocess.run(["gh", "--version"], capture_output=True, text=True)
@@ -45,9 +132,7 @@ class TestGitHubCLIDetection:
     def test_github_cli_old_version(self, mock_run):
         """Test handling of old GitHub CLI version."""
         # Mock old version
-        mock_run.return_value = Mock(
-            returncode=0, stdout="gh version 1.0.0\n", stderr=""
-        )
+        mock_run.return_value = _GH_VERSION_OLD
 
         result = subprocess.run(["gh", "--version"], capture_output=True, text=True)
 
@@ -64,11 +149,7 @@ class TestGitHubAuthentication:
     def test_github_auth_status_authenticated(self, mock_run):
         """Test authentication status when user is authenticated."""
         # Mock successful auth status
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="github.com\n  ✓ Logged in to github.com as testuser (oauth_token)\n",
-            stderr="",
-        )
+        mock_run.return_value = _GH_AUTH_OK
 
         result = subprocess.run(
             ["gh", "auth", "status"], capture_output=True, text=True
@@ -81,11 +162,7 @@ class TestGitHubAuthentication:
     def test_github_auth_status_not_authenticated(self, mock_run):
         """Test authentication status when user is not authenticated."""
         # Mock unauthenticated status
-        mock_run.return_value = Mock(
-            returncode=1,
-            stdout="",
-            stderr="You are not logged into any GitHub hosts. Run gh auth login to authenticate.\n",
-        )
+        mock_run.return_value = _GH_AUTH_MISSING
 
         result = subprocess.run(
             ["gh", "auth", "status"], capture_output=True, text=True
@@ -98,9 +175,7 @@ class TestGitHubAuthentication:
     def test_github_auth_token_validation(self, mock_run):
         """Test validation of GitHub authentication token."""
         # Mock successful token validation
-        mock_run.return_value = Mock(
-            returncode=0, stdout='{"login": "testuser", "id": 12345}\n', stderr=""
-        )
+        mock_run.return_value = _GH_API_USER_OK
 
         result = subprocess.run(["gh", "api", "user"], capture_output=True, text=True)
 
@@ -111,11 +186,7 @@ class TestGitHubAuthentication:
     def test_github_auth_token_expired(self, mock_run):
         """Test handling of expired authentication token."""
         # Mock expired token response
-        mock_run.return_value = Mock(
-            returncode=1,
-            stdout="",
-            stderr="HTTP 401: Bad credentials (https://api.github.com/user)\n",
-        )
+        mock_run.return_value = _GH_BAD_CREDENTIALS
 
         result = subprocess.run(["gh", "api", "user"], capture_output=True, text=True)
 
@@ -130,11 +201,7 @@ class TestRepositoryValidation:
     def test_validate_repository_exists(self, mock_run):
         """Test validation of existing repository."""
         # Mock successful repository info retrieval
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout='{"name": "test-repo", "owner": {"login": "testuser"}, "clone_url": "https://github.com/testuser/test-repo.git"}\n',
-            stderr="",
-        )
+        mock_run.return_value = _GH_REPO_OK
 
         result = subprocess.run(
             ["gh", "api", "repos/testuser/test-repo"], capture_output=True, text=True
@@ -147,11 +214,7 @@ class TestRepositoryValidation:
     def test_validate_repository_not_found(self, mock_run):
         """Test validation of non-existent repository."""
         # Mock repository not found
-        mock_run.return_value = Mock(
-            returncode=1,
-            stdout="",
-            stderr="HTTP 404: Not Found (https://api.github.com/repos/testuser/nonexistent)\n",
-        )
+        mock_run.return_value = _GH_REPO_NOT_FOUND
 
         result = subprocess.run(
             ["gh", "api", "repos/testuser/nonexistent"], capture_output=True, text=True
@@ -164,11 +227,7 @@ class TestRepositoryValidation:
     def test_validate_repository_access_denied(self, mock_run):
         """Test validation when access is denied to repository."""
         # Mock access denied
-        mock_run.return_value = Mock(
-            returncode=1,
-            stdout="",
-            stderr="HTTP 403: Forbidden (https://api.github.com/repos/private/repo)\n",
-        )
+        mock_run.return_value = _GH_REPO_FORBIDDEN
 
         result = subprocess.run(
             ["gh", "api", "repos/private/repo"], capture_output=True, text=True
@@ -189,9 +248,7 @@ class TestRepositoryValidation:
 
         for url in test_urls:
             # Mock successful validation for all formats
-            mock_run.return_value = Mock(
-                returncode=0, stdout='{"name": "repo"}\n', stderr=""
-            )
+            mock_run.return_value = _GH_REPO_NAME_OK
 
             # In implementation, would parse URL and validate
             # For now, just verify we can handle different formats
@@ -205,9 +262,7 @@ class TestRepositoryOperations:
     def test_clone_repository(self, mock_run):
         """Test cloning a repository."""
         # Mock successful clone
-        mock_run.return_value = Mock(
-            returncode=0, stdout="Cloning into 'test-repo'...\n", stderr=""
-        )
+        mock_run.return_value = _GH_CLONE_OK
 
         result = subprocess.run(
             ["gh", "repo", "clone", "testuser/test-repo"],
@@ -222,9 +277,7 @@ class TestRepositoryOperations:
     def test_clone_repository_failed(self, mock_run):
         """Test failed repository clone."""
         # Mock failed clone
-        mock_run.return_value = Mock(
-            returncode=1, stdout="", stderr="ERROR: Repository not found\n"
-        )
+        mock_run.return_value = _GH_CLONE_NOT_FOUND
 
         result = subprocess.run(
             ["gh", "repo", "clone", "testuser/nonexistent"],
@@ -239,11 +292,7 @@ class TestRepositoryOperations:
     def test_check_repository_permissions(self, mock_run):
         """Test checking repository permissions."""
         # Mock permission check
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout='{"permissions": {"admin": false, "push": true, "pull": true}}\n',
-            stderr="",
-        )
+        mock_run.return_value = _GH_PERMISSIONS_OK
 
         result = subprocess.run(
             ["gh", "api", "repos/testuser/test-repo", "--jq", ".permissions"],
@@ -257,11 +306,7 @@ class TestRepositoryOperations:
     def test_list_repository_contents(self, mock_run):
         """Test listing repository contents."""
         # Mock repository contents
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout='[{"name": ".claude", "type": "dir"}, {"name": "README.md", "type": "file"}]\n',
-            stderr="",
-        )
+        mock_run.return_value = _GH_CONTENTS_OK
 
         result = subprocess.run(
             ["gh", "api", "repos/testuser/test-repo/contents"],
@@ -285,46 +330,28 @@ class TestGitHubErrorHandling:
         with pytest.raises(subprocess.TimeoutExpired):
             subprocess.run(["gh", "api", "user"], timeout=30)
 
+    @pytest.mark.parametrize(
+        "args,response,message",
+        [
+            (["gh", "api", "user"], _GH_RATE_LIMITED, "rate limit exceeded"),
+            (["gh", "api", "user"], _GH_UNAVAILABLE, "Service Unavailable"),
+            (
+                ["gh", "repo", "clone", "invalid-url"],
+                _GH_INVALID_URL,
+                "invalid repository URL",
+            ),
+        ],
+        ids=["rate_limit", "service_unavailable", "invalid_url"],
+    )
     @patch("subprocess.run")
-    def test_rate_limit_error(self, mock_run):
-        """Test handling of GitHub API rate limit."""
-        # Mock rate limit error
-        mock_run.return_value = Mock(
-            returncode=1, stdout="", stderr="HTTP 403: API rate limit exceeded\n"
-        )
-
-        result = subprocess.run(["gh", "api", "user"], capture_output=True, text=True)
-
-        assert result.returncode == 1
-        assert "rate limit exceeded" in result.stderr
-
-    @patch("subprocess.run")
-    def test_github_service_unavailable(self, mock_run):
-        """Test handling when GitHub service is unavailable."""
-        # Mock service unavailable
-        mock_run.return_value = Mock(
-            returncode=1, stdout="", stderr="HTTP 503: Service Unavailable\n"
-        )
+    def test_github_error_response(self, mock_run, args, response, message):
+        """Test handling of rate limits, outages and invalid GitHub URLs."""
+        mock_run.return_value = response
 
-        result = subprocess.run(["gh", "api", "user"], capture_output=True, text=True)
+        result = subprocess.run(args, capture_output=True, text=True)
 
         assert result.returncode == 1
-        assert "Service Unavailable" in result.stderr
-
-    @patch("subprocess.run")
-    def test_invalid_github_url(self, mock_run):
-        """Test handling of invalid GitHub URLs."""
-        # Mock invalid URL error
-        mock_run.return_value = Mock(
-            returncode=1, stdout="", stderr="ERROR: invalid repository URL\n"
-        )
-
-        result = subprocess.run(
-            ["gh", "repo", "clone", "invalid-url"], capture_output=True, text=True
-        )
-
-        assert result.returncode == 1
-        assert "invalid repository URL" in result.stderr
+        assert message in result.stderr
 
 
 class TestGitHubIntegrationMocking:
@@ -348,24 +375,10 @@ class TestGitHubIntegrationMocking:
     def test_mock_subprocess_calls(self):
         """Test mocking of subprocess calls to gh command."""
         with patch("subprocess.run") as mock_run:
-            # Configure different responses for different commands
-            mock_responses = {
-                ("gh", "--version"): Mock(returncode=0, stdout="gh version 2.40.1\n"),
-                ("gh", "auth", "status"): Mock(
-                    returncode=0, stdout="Logged in as testuser\n"
-                ),
-                ("gh", "api", "user"): Mock(
-                    returncode=0, stdout='{"login": "testuser"}\n'
-                ),
-            }
-
-            def side_effect(args, **kwargs):
-                key = tuple(args) if isinstance(args, list) else args
-                return mock_responses.get(
-                    key, Mock(returncode=1, stderr="Unknown command")
-                )
-
-            mock_run.side_effect = side_effect
+            # Dispatch each command to its canned response
+            mock_run.side_effect = lambda args, **kwargs: _GH_RESPONSE_TABLE.get(
+                tuple(args), _GH_UNKNOWN_COMMAND
+            )
 
             # Test version check
             result = subprocess.run(["gh", "--version"], capture_output=True, text=True)
@@ -381,21 +394,7 @@ class TestGitHubIntegrationMocking:
 
     def test_mock_github_api_responses(self):
         """Test mocking of GitHub API responses."""
-        # Mock API responses for different endpoints
-        api_responses = {
-            "/user": {"login": "testuser", "id": 12345},
-            "/repos/testuser/test-repo": {
-                "name": "test-repo",
-                "owner": {"login": "testuser"},
-                "permissions": {"admin": False, "push": True, "pull": True},
-            },
-            "/repos/testuser/test-repo/contents": [
-                {"name": ".claude", "type": "dir"},
-                {"name": "README.md", "type": "file"},
-            ],
-        }
-
         # Verify mock data structure
-        assert api_responses["/user"]["login"] == "testuser"
-        assert api_responses["/repos/testuser/test-repo"]["name"] == "test-repo"
-        assert len(api_responses["/repos/testuser/test-repo/contents"]) == 2
+        assert _API_RESPONSES["/user"]["login"] == "testuser"
+        assert _API_RESPONSES["/repos/testuser/test-repo"]["name"] == "test-repo"
+        assert len(_API_RESPONSES["/repos/testuser/test-repo/contents"]) == 2
@@ -0,0 +1,256 @@
+"""
+Test deployment and update business operations.
+
+Covers:
+- FR-002: Update existing .claude commands from the source repository
+- FR-003: Backup protection before updates
+"""
+
+import os
+import shutil
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from specli.github import GitHubRepositoryError
+from specli.operations import (
+    TMPFS_MIN_FREE_BYTES,
+    _get_temp_root,
+    update_claude_commands,
+)
+from specli.output import format_success_message
+
+SOURCE_URL = "https://github.com/user/source"
+
+
+@pytest.fixture
+def claude_target(target_repo, existing_claude):
+    """Target repository that already has a .claude folder."""
+    shutil.copytree(existing_claude, target_repo / ".claude")
+    return target_repo
+
+
+@pytest.fixture
+def clone_calls(monkeypatch, source_repo):
+    """Replace clone_repository with a local copy of the source fixture."""
+    calls = []
+
+    def fake_clone(repo_url, target_dir):
+        calls.append(target_dir)
+        repository_path = target_dir / "source"
+        shutil.copytree(source_repo / ".claude", repository_path / ".claude")
+        return {"success": True, "repository_path": repository_path}
+
+    monkeypatch.setattr("specli.github.clone_repository", fake_clone)
+    return calls
+
+
+@pytest.fixture
+def up_to_date_target(target_repo, source_repo, existing_claude):
+    """Target whose .claude matches the source plus preserved local files."""
+    target_claude = target_repo / ".claude"
+    shutil.copytree(source_repo / ".claude", target_claude)
+    for local_file in ("settings.local.json", "commands/local_command.md"):
+        shutil.copy2(existing_claude / local_file, target_claude / local_file)
+    return target_repo
+
+
+def _mtimes(claude_folder):
+    """Map each file below a .claude folder to its modification time."""
+    return {
+        path: path.stat().st_mtime_ns
+        for path in claude_folder.rglob("*")
+        if path.is_file()
+    }
+
+
+@pytest.fixture
+def confirm_backup(monkeypatch):
+    """Answer yes to the backup prompt."""
+    monkeypatch.setattr("specli.backup.confirm", lambda text, default: True)
+
+
+class TestUpdateBackupAndClone:
+    """Test update running the backup and the clone side by side."""
+
+    def test_update_with_backup_and_clone(
+        self, monkeypatch, tmp_path, claude_target, clone_calls, confirm_backup
+    ):
+        """A successful backup and clone should both feed the update result."""
+        backup_path = tmp_path / "backup"
+        monkeypatch.setattr(
+            "specli.backup.BackupManager.create_claude_backup",
+            lambda self: {"success": True, "backup_path": backup_path},
+        )
+
+        result = update_claude_commands(claude_target, SOURCE_URL)
+
+        assert result["success"] is True
+        assert result["details"]["backup_created"] is True
+        assert result["details"]["backup_path"] == str(backup_path)
+        assert (claude_target / ".claude" / "commands" / "analyze.md").exists()
+        assert len(clone_calls) == 1
+        assert not clone_calls[0].exists()
+
+    def test_update_backup_failure_does_not_wait_for_clone(
+        self, monkeypatch, claude_target, confirm_backup
+    ):
+        """A failed backup should return at once and clean up after the clone."""
+        clone_started = threading.Event()
+        release_clone = threading.Event()
+        clone_finished = threading.Event()
+        clone_dirs = []
+
+        def slow_clone(repo_url, target_dir):
+            clone_dirs.append(target_dir)
+            clone_started.set()
+            release_clone.wait(timeout=5)
+            clone_finished.set()
+            raise GitHubRepositoryError("clone abandoned")
+
+        def failing_backup(self):
+            # Fail only once the clone is underway, so it cannot be cancelled
+            clone_started.wait(timeout=5)
+            return {"success": False, "error": "disk full"}
+
+        monkeypatch.setattr("specli.github.clone_repository", slow_clone)
+        monkeypatch.setattr(
+            "specli.backup.BackupManager.create_claude_backup", failing_backup
+        )
+
+        result = update_claude_commands(claude_target, SOURCE_URL)
+        returned_before_clone = not clone_finished.is_set()
+        release_clone.set()
+
+        assert returned_before_clone
+        assert result["success"] is False
+        assert result["message"] == "Backup failed: disk full"
+
+        deadline = time.monotonic() + 5
+        while clone_dirs[0].exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not clone_dirs[0].exists()
+
+    def test_update_reports_clone_exception(
+        self, monkeypatch, tmp_path, claude_target, confirm_backup
+    ):
+        """An exception raised by the clone should surface as a failed update."""
+        clone_dirs = []
+
+        def failing_clone(repo_url, target_dir):
+            clone_dirs.append(target_dir)
+            raise GitHubRepositoryError("Failed to clone user/source: not found")
+
+        monkeypatch.setattr("specli.github.clone_repository", failing_clone)
+        monkeypatch.setattr(
+            "specli.backup.BackupManager.create_claude_backup",
+            lambda self: {"success": True, "backup_path": tmp_path / "backup"},
+        )
+
+        result = update_claude_commands(claude_target, SOURCE_URL)
+
+        assert result["success"] is False
+        assert "Failed to clone user/source: not found" in result["error"]
+        assert not clone_dirs[0].exists()
+
+
+class TestUpdateNoChanges:
+    """Test the short-circuit for targets that already match the source."""
+
+    def test_update_skips_merge_when_target_is_up_to_date(
+        self, up_to_date_target, clone_calls
+    ):
+        """Local-only files should not stop an identical tree short-circuiting."""
+        target_claude = up_to_date_target / ".claude"
+        for path in target_claude.rglob("*"):
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        mtimes_before = _mtimes(target_claude)
+
+        result = update_claude_commands(up_to_date_target, SOURCE_URL, no_backup=True)
+
+        details = result["details"]
+        assert result["success"] is True
+        assert details["files_updated"] == 0
+        assert details["no_changes"] is True
+        assert details["config_saved"] is True
+        assert (up_to_date_target / "specli.settings.json").exists()
+        assert _mtimes(target_claude) == mtimes_before
+        assert format_success_message("update", details) == (
+            f".claude folder in {up_to_date_target} is already up to date"
+        )
+
+    def test_update_counts_preserved_files_when_up_to_date(
+        self, monkeypatch, up_to_date_target, source_repo
+    ):
+        """The no-changes result should count preserved source files."""
+
+        def clone_with_local_settings(repo_url, target_dir):
+            source_claude = target_dir / "source" / ".claude"
+            shutil.copytree(source_repo / ".claude", source_claude)
+            (source_claude / "settings.local.json").write_bytes(b"{}")
+            return {"success": True, "repository_path": source_claude.parent}
+
+        monkeypatch.setattr("specli.github.clone_repository", clone_with_local_settings)
+
+        result = update_claude_commands(up_to_date_target, SOURCE_URL, no_backup=True)
+
+        assert result["details"]["no_changes"] is True
+        assert result["details"]["files_preserved"] == 1
+
+    def test_update_copies_a_single_modified_file(
+        self, up_to_date_target, source_repo, clone_calls
+    ):
+        """One changed command should still be merged from the source."""
+        target_deploy = up_to_date_target / ".claude" / "commands" / "deploy.md"
+        target_deploy.write_bytes(b"# Locally edited")
+
+        result = update_claude_commands(up_to_date_target, SOURCE_URL, no_backup=True)
+
+        details = result["details"]
+        assert result["success"] is True
+        assert details["files_updated"] == 1
+        assert "no_changes" not in details
+        assert (
+            target_deploy.read_bytes()
+            == (source_repo / ".claude" / "commands" / "deploy.md").read_bytes()
+        )
+
+
+class TestTempRoot:
+    """Test choosing tmpfs for temporary clones."""
+
+    @pytest.fixture
+    def tmpfs(self, monkeypatch, tmp_path):
+        """Point TMPFS_ROOT at a directory under tmp_path that may not exist."""
+        root = tmp_path / "shm"
+        monkeypatch.setattr("specli.operations.TMPFS_ROOT", root)
+        return root
+
+    def _free_space(self, monkeypatch, free):
+        """Make shutil.disk_usage report the given free bytes."""
+        monkeypatch.setattr(
+            "specli.operations.shutil.disk_usage",
+            lambda path: SimpleNamespace(free=free),
+        )
+
+    def test_uses_tmpfs_with_enough_space(self, monkeypatch, tmpfs):
+        """A writable tmpfs with room to spare should host the clone."""
+        tmpfs.mkdir()
+        self._free_space(monkeypatch, TMPFS_MIN_FREE_BYTES)
+
+        assert _get_temp_root() == str(tmpfs)
+
+    def test_falls_back_when_tmpfs_is_nearly_full(self, monkeypatch, tmpfs):
+        """A tmpfs below the free-space floor should not be used."""
+        tmpfs.mkdir()
+        self._free_space(monkeypatch, TMPFS_MIN_FREE_BYTES - 1)
+
+        assert _get_temp_root() is None
+
+    def test_falls_back_without_tmpfs(self, monkeypatch, tmpfs):
+        """A missing tmpfs should leave the system default temp directory."""
+        self._free_space(monkeypatch, TMPFS_MIN_FREE_BYTES)
+
+        assert _get_temp_root() is None